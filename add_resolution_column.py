@@ -2,7 +2,9 @@
 Migration script to add resolution column to existing pnl_records table.
 """
 
+import sqlite3
 from database import Database
+from query_by_sector import refresh_pnl_sector_daily
 
 def migrate_add_resolution():
     """Add resolution column to pnl_records and update existing data."""
@@ -21,6 +23,13 @@ def migrate_add_resolution():
         result = db.execute("UPDATE pnl_records SET resolution = 'monthly'")
         print(f"  [OK] Updated {result.rowcount} existing records to 'monthly' resolution")
 
+        # Rebuild sector summary from the migrated records
+        try:
+            refresh_pnl_sector_daily(db)
+            print("  [OK] Rebuilt sector summary (pnl_sector_daily)")
+        except sqlite3.OperationalError:
+            print("  [INFO] No pnl_sector_daily table yet; it is built on first use")
+
         # Create indexes for performance
         db.execute("CREATE INDEX IF NOT EXISTS idx_pnl_resolution ON pnl_records(resolution)")
         print("  [OK] Created idx_pnl_resolution")
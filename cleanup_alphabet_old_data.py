@@ -7,6 +7,7 @@ Deletes:
 """
 
 from database import Database
+from query_by_sector import refresh_pnl_sector_daily
 
 def cleanup_old_alphabet_data():
     """Delete old Alphabet MFT data and temporary markets."""
@@ -43,6 +44,9 @@ def cleanup_old_alphabet_data():
                     (program_id,)
                 )
                 print(f"[OK] Deleted {record_count} pnl_records")
+
+                # Drop the deleted records from the sector summary
+                refresh_pnl_sector_daily(db, program_id)
             else:
                 print("[INFO] Skipped pnl_records deletion")
                 return
@@ -18,6 +18,7 @@ from datetime import date, datetime
 import hashlib
 import json
 from pathlib import Path
+from types import MappingProxyType
 
 
 @dataclass
@@ -142,13 +143,26 @@ class ComponentRegistry:
             component: ComponentDefinition to register
 
         Raises:
-            ValueError: If component ID already registered
+            ValueError: If component ID already registered or the registry is frozen
         """
+        if isinstance(self._components, MappingProxyType):
+            raise ValueError(f"Cannot register '{component.id}': registry is frozen")
+
         if component.id in self._components:
             raise ValueError(f"Component '{component.id}' already registered")
 
         self._components[component.id] = component
 
+    def freeze(self):
+        """
+        Make the registry read-only once registration is complete.
+
+        Batch code can then hold on to ComponentDefinition objects (or the registry
+        itself) knowing the set of components will not change underneath it.
+        """
+        if not isinstance(self._components, MappingProxyType):
+            self._components = MappingProxyType(dict(self._components))
+
     def get(self, component_id: str) -> Optional[ComponentDefinition]:
         """Get a component by ID."""
         return self._components.get(component_id)
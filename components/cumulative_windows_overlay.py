@@ -15,42 +15,40 @@ Features:
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import date
 
 
-def calculate_cumulative_nav(daily_returns: List[float], starting_nav: float = 10_000_000) -> List[float]:
+def calculate_cumulative_nav(daily_returns: Union[List[float], np.ndarray],
+                             starting_nav: float = 10_000_000) -> np.ndarray:
     """
     Calculate cumulative NAV from daily returns using compounding.
 
     Args:
-        daily_returns: List of daily returns as decimals (0.01 = 1%)
+        daily_returns: Daily returns as decimals (0.01 = 1%), list or array
         starting_nav: Initial NAV value (default: $10M)
 
     Returns:
-        List of NAV values, including day 0 (starting NAV)
+        Array of NAV values, including day 0 (starting NAV)
 
     Example:
         returns = [0.01, -0.005, 0.02]
         nav = calculate_cumulative_nav(returns, 10_000_000)
         # Returns: [10_000_000, 10_100_000, 10_049_500, 10_250_490]
     """
-    if not daily_returns:
-        return [starting_nav]
+    returns = np.asarray(daily_returns, dtype=np.float64)
 
-    # Start with initial NAV
-    nav_curve = [starting_nav]
-
-    # Compound each day's return
-    current_nav = starting_nav
-    for daily_return in daily_returns:
-        current_nav = current_nav * (1 + daily_return)
-        nav_curve.append(current_nav)
+    # Day 0 is the starting NAV, then compound each day's return
+    nav_curve = np.empty(len(returns) + 1)
+    nav_curve[0] = starting_nav
+    np.cumprod(1.0 + returns, out=nav_curve[1:])
+    nav_curve[1:] *= starting_nav
 
     return nav_curve
 
 
-def calculate_cumulative_nav_additive(daily_returns: List[float], starting_nav: float = 10_000_000) -> List[float]:
+def calculate_cumulative_nav_additive(daily_returns: Union[List[float], np.ndarray],
+                                      starting_nav: float = 10_000_000) -> np.ndarray:
     """
     Calculate cumulative NAV from daily returns using additive (non-compounded) method.
 
@@ -58,11 +56,11 @@ def calculate_cumulative_nav_additive(daily_returns: List[float], starting_nav:
     This shows the simple sum of returns without geometric compounding.
 
     Args:
-        daily_returns: List of daily returns as decimals (0.01 = 1%)
+        daily_returns: Daily returns as decimals (0.01 = 1%), list or array
         starting_nav: Initial NAV value (default: $10M)
 
     Returns:
-        List of NAV values, including day 0 (starting NAV)
+        Array of NAV values, including day 0 (starting NAV)
 
     Example:
         returns = [0.01, -0.005, 0.02]
@@ -72,22 +70,34 @@ def calculate_cumulative_nav_additive(daily_returns: List[float], starting_nav:
         # Day 2: $10.1M + ($10M × -0.005) = $10.05M
         # Day 3: $10.05M + ($10M × 0.02) = $10.25M
     """
-    if not daily_returns:
-        return [starting_nav]
-
-    # Start with initial NAV
-    nav_curve = [starting_nav]
+    returns = np.asarray(daily_returns, dtype=np.float64)
 
-    # Add each day's dollar return (based on original starting NAV)
-    current_nav = starting_nav
-    for daily_return in daily_returns:
-        dollar_change = starting_nav * daily_return
-        current_nav = current_nav + dollar_change
-        nav_curve.append(current_nav)
+    # Day 0 is the starting NAV, then add each day's dollar return (based on original starting NAV)
+    nav_curve = np.empty(len(returns) + 1)
+    nav_curve[0] = starting_nav
+    np.cumsum(returns, out=nav_curve[1:])
+    nav_curve[1:] = starting_nav + starting_nav * nav_curve[1:]
 
     return nav_curve
 
 
+def _returns_frame(data) -> pd.DataFrame:
+    """
+    Build a ['date', 'return'] DataFrame from (date, return) rows.
+
+    Rows are transposed into two columns first so pandas builds each column from
+    a single typed array instead of inspecting every sqlite3.Row.
+    """
+    if not data:
+        return pd.DataFrame(columns=['date', 'return'])
+
+    dates, returns = zip(*data)
+    return pd.DataFrame({
+        'date': pd.to_datetime(dates),
+        'return': np.fromiter(returns, dtype=np.float64, count=len(returns))
+    })
+
+
 def get_daily_returns_for_window(db, program_id: int, start_date: date, end_date: date) -> pd.DataFrame:
     """
     Fetch daily returns for a program within a date window.
@@ -117,13 +127,7 @@ def get_daily_returns_for_window(db, program_id: int, start_date: date, end_date
 
     data = db.fetch_all(query, (program_id, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
 
-    if not data:
-        return pd.DataFrame(columns=['date', 'return'])
-
-    df = pd.DataFrame(data, columns=['date', 'return'])
-    df['date'] = pd.to_datetime(df['date'])
-
-    return df
+    return _returns_frame(data)
 
 
 def get_benchmark_returns_for_window(db, benchmark_market_id: int, start_date: date, end_date: date) -> pd.DataFrame:
@@ -151,13 +155,116 @@ def get_benchmark_returns_for_window(db, benchmark_market_id: int, start_date: d
 
     data = db.fetch_all(query, (benchmark_market_id, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
 
+    return _returns_frame(data)
+
+
+def _windows_cte(windows: List[Tuple[date, date]]) -> Tuple[str, list]:
+    """
+    Build a `w(idx, start_date, end_date)` VALUES CTE for a list of (start, end) windows.
+
+    Returns:
+        (sql, params) where sql is the WITH clause and params its bind values
+    """
+    values = ', '.join(['(?, ?, ?)'] * len(windows))
+    params = []
+    for idx, (start_date, end_date) in enumerate(windows):
+        params.extend((idx, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
+    return f"WITH w(idx, start_date, end_date) AS (VALUES {values})", params
+
+
+def _split_window_frames(data, n_windows: int) -> List[pd.DataFrame]:
+    """
+    Split (idx, date, return) rows ordered by idx into one ['date', 'return'] frame per window.
+
+    Windows with no rows get an empty frame.
+    """
     if not data:
-        return pd.DataFrame(columns=['date', 'return'])
+        return [_returns_frame([]) for _ in range(n_windows)]
+
+    idxs, dates, returns = zip(*data)
+    idxs = np.fromiter(idxs, dtype=np.intp, count=len(idxs))
+    all_dates = pd.to_datetime(dates)
+    all_returns = np.fromiter(returns, dtype=np.float64, count=len(returns))
+    bounds = np.searchsorted(idxs, np.arange(n_windows + 1))
+
+    return [
+        pd.DataFrame({
+            'date': all_dates[bounds[k]:bounds[k + 1]],
+            'return': all_returns[bounds[k]:bounds[k + 1]]
+        })
+        for k in range(n_windows)
+    ]
+
+
+def get_daily_returns_for_windows(db, program_id: int,
+                                  windows: List[Tuple[date, date]]) -> List[pd.DataFrame]:
+    """
+    Fetch daily program returns for several date windows in one query.
+
+    Same per-window result as get_daily_returns_for_window(), but all windows are
+    joined against pnl_records in a single statement. Windows may overlap (e.g.
+    borrowed data), each gets its own copy of the shared days.
+
+    Args:
+        db: Database connection
+        program_id: Program ID to query
+        windows: List of (start_date, end_date) tuples, both inclusive
+
+    Returns:
+        List of DataFrames with columns ['date', 'return'], one per window
+    """
+    if not windows:
+        return []
+
+    cte, params = _windows_cte(windows)
+    query = f"""
+        {cte}
+        SELECT w.idx, pr.date, SUM(pr.return) as total_return
+        FROM w
+        JOIN pnl_records pr ON pr.date >= w.start_date AND pr.date <= w.end_date
+        JOIN markets m ON pr.market_id = m.id
+        WHERE pr.program_id = ?
+          AND pr.resolution = 'daily'
+          AND m.is_benchmark = 0
+        GROUP BY w.idx, pr.date
+        ORDER BY w.idx, pr.date
+    """
+
+    data = db.fetch_all(query, (*params, program_id))
+
+    return _split_window_frames(data, len(windows))
+
+
+def get_benchmark_returns_for_windows(db, benchmark_market_id: int,
+                                      windows: List[Tuple[date, date]]) -> List[pd.DataFrame]:
+    """
+    Fetch daily benchmark returns for several date windows in one query.
+
+    Args:
+        db: Database connection
+        benchmark_market_id: Market ID for benchmark (e.g., SP500)
+        windows: List of (start_date, end_date) tuples, both inclusive
+
+    Returns:
+        List of DataFrames with columns ['date', 'return'], one per window
+    """
+    if not windows:
+        return []
+
+    cte, params = _windows_cte(windows)
+    query = f"""
+        {cte}
+        SELECT w.idx, pr.date, pr.return
+        FROM w
+        JOIN pnl_records pr ON pr.date >= w.start_date AND pr.date <= w.end_date
+        WHERE pr.market_id = ?
+          AND pr.resolution = 'daily'
+        ORDER BY w.idx, pr.date
+    """
 
-    df = pd.DataFrame(data, columns=['date', 'return'])
-    df['date'] = pd.to_datetime(df['date'])
+    data = db.fetch_all(query, (*params, benchmark_market_id))
 
-    return df
+    return _split_window_frames(data, len(windows))
 
 
 def generate_cumulative_windows_overlay(
@@ -214,8 +321,8 @@ def generate_cumulative_windows_overlay(
             continue
 
         # Calculate cumulative NAV
-        nav_curve = calculate_cumulative_nav(program_df['return'].tolist(), starting_nav)
-        trading_days = list(range(len(nav_curve)))
+        nav_curve = calculate_cumulative_nav(program_df['return'].to_numpy(), starting_nav)
+        trading_days = np.arange(len(nav_curve))
 
         # Add strategy line (solid)
         fig.add_trace(go.Scatter(
@@ -235,8 +342,8 @@ def generate_cumulative_windows_overlay(
             if len(benchmark_df) > 0:
                 # Calculate benchmark NAV curve directly (don't merge with program dates)
                 # Benchmark may have different trading days, so we plot it independently
-                benchmark_nav_curve = calculate_cumulative_nav(benchmark_df['return'].tolist(), starting_nav)
-                benchmark_trading_days = list(range(len(benchmark_nav_curve)))
+                benchmark_nav_curve = calculate_cumulative_nav(benchmark_df['return'].to_numpy(), starting_nav)
+                benchmark_trading_days = np.arange(len(benchmark_nav_curve))
 
                 fig.add_trace(go.Scatter(
                     x=benchmark_trading_days,
@@ -19,7 +19,7 @@ import numpy as np
 import plotly.graph_objects as go
 from typing import List, Optional
 from datetime import date
-from windows import generate_window_definitions_overlapping_by_days
+from windows import generate_window_bounds_overlapping_by_days
 
 
 def calculate_cagr(returns: np.ndarray, start_date: date, end_date: date) -> float:
@@ -147,35 +147,42 @@ def calculate_rolling_cagr_series(
     """
     Calculate rolling CAGR for all windows using in-memory slicing (fast).
 
+    Works on log-growth prefix sums of the full series: each window's rows are
+    located with searchsorted, its compounded growth is exp(cumlog[hi] - cumlog[lo]),
+    and the CAGRs of all windows come from one vectorized power step. Same figures
+    as calculate_cagr() per window.
+
     Args:
-        full_returns_df: DataFrame with all daily returns for full period
-        window_definitions: List of WindowDefinition objects
+        full_returns_df: DataFrame with all daily returns for full period (date order)
+        window_definitions: List of WindowDefinition or WindowBounds objects
         entity_name: Name for this series (e.g., "MFT" or "SP500")
 
     Returns:
         DataFrame with columns: ['date', 'cagr', 'entity']
     """
-    results = []
+    dates = full_returns_df['date'].to_numpy()
+    returns = full_returns_df['return'].to_numpy(dtype=np.float64)
+    cumlog = np.concatenate(([0.0], np.cumsum(np.log1p(returns))))
 
-    for window_def in window_definitions:
-        # Slice returns for this window (in-memory, fast)
-        mask = (
-            (full_returns_df['date'] >= pd.Timestamp(window_def.start_date)) &
-            (full_returns_df['date'] <= pd.Timestamp(window_def.end_date))
-        )
-        window_returns = full_returns_df[mask]['return'].values
+    starts = np.array([np.datetime64(w.start_date, 'D') for w in window_definitions], dtype='datetime64[D]')
+    ends = np.array([np.datetime64(w.end_date, 'D') for w in window_definitions], dtype='datetime64[D]')
+    years = np.array([w.years for w in window_definitions], dtype=np.float64)
 
-        # Calculate CAGR for this window
-        cagr = calculate_cagr(window_returns, window_def.start_date, window_def.end_date)
+    # Row range [lo, hi) of each window (returns are in date order)
+    lo = np.searchsorted(dates, starts.astype(dates.dtype), side='left')
+    hi = np.searchsorted(dates, ends.astype(dates.dtype), side='right')
 
-        # Store result (use window END date as X-axis value)
-        results.append({
-            'date': window_def.end_date,
-            'cagr': cagr,
-            'entity': entity_name
-        })
+    # CAGR = growth ** (1 / years) - 1; NaN for empty windows or non-positive spans
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cagr = np.expm1((cumlog[hi] - cumlog[lo]) / years)
+    cagr[(hi == lo) | (years <= 0)] = np.nan
 
-    return pd.DataFrame(results)
+    # Use window END date as X-axis value
+    return pd.DataFrame({
+        'date': [w.end_date for w in window_definitions],
+        'cagr': cagr,
+        'entity': entity_name
+    })
 
 
 def generate_rolling_cagr_chart(
@@ -234,15 +241,12 @@ def generate_rolling_cagr_chart(
     min_date = date.fromisoformat(date_range['min_date'])
     max_date = date.fromisoformat(date_range['max_date'])
 
-    # Generate window definitions (1-day slide)
-    window_defs = generate_window_definitions_overlapping_by_days(
+    # Generate window bounds (1-day slide); only the dates are needed here
+    window_defs = generate_window_bounds_overlapping_by_days(
         start_date=min_date,
         end_date=max_date,
         window_length_months=window_months,
-        slide_days=1,
-        program_ids=[program_id],
-        benchmark_ids=[],
-        window_set_name=f"rolling_{window_months}m"
+        slide_days=1
     )
 
     print(f"Generated {len(window_defs)} rolling windows ({window_months} months, 1-day slide)")
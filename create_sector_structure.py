@@ -7,6 +7,7 @@ Creates two grouping schemes:
 """
 
 from database import Database
+from query_by_sector import refresh_pnl_sector_daily
 
 # Sector definitions
 MFT_SECTORS = [
@@ -119,6 +120,12 @@ def create_market_mappings(db, grouping_name, mappings):
                 total_mappings += 1
 
     print(f"\n[INFO] Created {total_mappings} new mappings")
+
+    # Sector summaries of already imported records must pick up the new mappings
+    if total_mappings:
+        refresh_pnl_sector_daily(db)
+        print("[OK] Rebuilt sector summary (pnl_sector_daily)")
+
     return total_mappings
 
 
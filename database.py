@@ -3,11 +3,40 @@ Database module for PnL Report Generator.
 Handles SQLite database initialization and connection management.
 """
 
+import math
 import sqlite3
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 
+def _sql_log1p(value):
+    """log1p for SQL; NULL in gives NULL out so SUM() skips it."""
+    return None if value is None else math.log1p(value)
+
+
+class LRUCache(OrderedDict):
+    """Dict that keeps only its maxsize most recently used entries."""
+
+    def __init__(self, maxsize: int = 256):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
 class Database:
     """Database manager for PnL Report Generator."""
 
@@ -20,6 +49,8 @@ class Database:
         """
         self.db_path = Path(db_path)
         self.connection: Optional[sqlite3.Connection] = None
+        self._caches = {}
+        self._cache_stamp = None
 
     def connect(self) -> sqlite3.Connection:
         """
@@ -29,8 +60,17 @@ class Database:
             SQLite connection object
         """
         if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path)
+            # Larger statement cache so repeated parametrized queries (e.g. per-sector
+            # lookups in query_by_sector.py) reuse their prepared statements
+            self.connection = sqlite3.connect(self.db_path, cached_statements=256)
             self.connection.row_factory = sqlite3.Row  # Enable column access by name
+            # Memory-map reads of the database file and allow a 64 MiB page cache,
+            # so repeated scans of pnl_records are served from memory
+            self.connection.execute("PRAGMA mmap_size = 268435456")
+            self.connection.execute("PRAGMA cache_size = -65536")
+            # log1p() for compounding in SQL: EXP(SUM(log1p(return))) is the
+            # growth factor of a return series
+            self.connection.create_function("log1p", 1, _sql_log1p, deterministic=True)
         return self.connection
 
     def close(self):
@@ -38,6 +78,9 @@ class Database:
         if self.connection:
             self.connection.close()
             self.connection = None
+        # change_stamp() counters restart with the next connection
+        self.clear_caches()
+        self._cache_stamp = None
 
     def initialize_schema(self):
         """
@@ -73,9 +116,12 @@ class Database:
             Cursor object with results
         """
         conn = self.connect()
+        changes = conn.total_changes
         cursor = conn.cursor()
         cursor.execute(query, params)
         conn.commit()
+        if conn.total_changes != changes:
+            self.clear_caches()
         return cursor
 
     def execute_many(self, query: str, params_list: list):
@@ -90,9 +136,12 @@ class Database:
             Cursor object
         """
         conn = self.connect()
+        changes = conn.total_changes
         cursor = conn.cursor()
         cursor.executemany(query, params_list)
         conn.commit()
+        if conn.total_changes != changes:
+            self.clear_caches()
         return cursor
 
     def fetch_all(self, query: str, params: tuple = ()) -> list:
@@ -123,6 +172,69 @@ class Database:
         cursor = self.execute(query, params)
         return cursor.fetchone()
 
+    def change_stamp(self) -> tuple:
+        """
+        Change counter for cache invalidation.
+
+        Combines this connection's own writes (total_changes) with commits from
+        other connections (PRAGMA data_version); it differs whenever the data may
+        have changed since it was last read. Both counters belong to the open
+        connection, so stamps are only comparable while it stays open and never
+        across Database instances.
+        """
+        conn = self.connect()
+        return (conn.total_changes, conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def cache(self, name: str, maxsize: int = 256) -> LRUCache:
+        """
+        Named memo for data read through this database.
+
+        All caches of the instance are emptied whenever the data may have
+        changed: writes through execute()/execute_many(), other writes on this
+        connection or commits by other connections (see change_stamp()), and
+        close().
+
+        Args:
+            name: Cache name, e.g. 'windows.series'
+            maxsize: Number of entries kept (least recently used are dropped)
+
+        Returns:
+            LRUCache for name
+        """
+        stamp = self.change_stamp()
+        if stamp != self._cache_stamp:
+            self.clear_caches()
+            self._cache_stamp = stamp
+
+        cache = self._caches.get(name)
+        if cache is None:
+            cache = self._caches[name] = LRUCache(maxsize)
+        return cache
+
+    def clear_caches(self):
+        """Empty every cache created by cache()."""
+        for cache in self._caches.values():
+            cache.clear()
+
+    def fetch_all_tuples(self, query: str, params: tuple = ()) -> list:
+        """
+        Fetch all rows from a query as plain tuples.
+
+        Skips the sqlite3.Row wrapper per row; use for large column scans that
+        are unpacked positionally (e.g. dates, rets = zip(*rows)).
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+
+        Returns:
+            List of tuples
+        """
+        cursor = self.connect().cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -9,9 +9,13 @@ Usage:
     python generate_all_components.py --manager alphabet --program mft --force
     python generate_all_components.py --manager alphabet --program mft --category charts
     python generate_all_components.py --manager alphabet --program mft --components equity_curve,cumulative_windows_5yr
+    python generate_all_components.py --manager alphabet --program mft --workers 4
 """
 
 import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from database import Database
@@ -115,6 +119,80 @@ def generate_component_file(
         return (filename if 'filename' in locals() else 'unknown', False, str(e))
 
 
+# Per-process database handle for batch workers (SQLite connections can't cross processes)
+_worker_db = None
+
+
+def _init_worker(db_path: str):
+    """
+    Open this worker process's own database connection and warm up ReportLab.
+
+    Building the (cached) disclaimer PDF loads ReportLab's fonts and style sheet
+    before the first real job lands on the worker.
+    """
+    global _worker_db
+    _worker_db = Database(db_path)
+    register_components._disclaimer_pdf_bytes()
+
+
+def _render_one(job: tuple) -> tuple:
+    """
+    Generate one component file in a batch worker process.
+
+    Args:
+        job: (component_id, manager_slug, program_slug, program_id, output_dir, variant, benchmarks)
+
+    Returns:
+        Tuple of (job, filename, success, message)
+    """
+    component_id, manager_slug, program_slug, program_id, output_dir, variant, benchmarks = job
+    component = get_registry().get(component_id)
+
+    filename, success, message = generate_component_file(
+        _worker_db,
+        component,
+        manager_slug,
+        program_slug,
+        program_id,
+        output_dir,
+        variant=variant,
+        benchmarks=benchmarks
+    )
+    return (job, filename, success, message)
+
+
+def generate_batch(db_path: str, jobs: list, max_workers: int = None) -> list:
+    """
+    Generate component files in parallel worker processes.
+
+    Each worker opens its own Database(db_path) and renders jobs independently, so
+    CPU-bound PDF building (ReportLab, Kaleido) scales with the number of cores.
+    Where the platform supports it, workers are forked so they inherit the
+    already-imported modules and populated component registry instead of
+    re-importing them.
+
+    Args:
+        db_path: Path to the SQLite database
+        jobs: List of job tuples as accepted by _render_one()
+        max_workers: Worker process count (default: os.cpu_count())
+
+    Returns:
+        List of (job, filename, success, message) tuples in job order
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+    else:
+        mp_context = None  # Platform default (spawn on Windows)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(db_path,)
+    ) as executor:
+        return list(executor.map(_render_one, jobs, chunksize=4))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate all components for a manager/program'
@@ -148,6 +226,17 @@ def main():
         '--output-dir',
         help='Custom output directory (default: export/{manager}/{program})'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Generate components in this many worker processes (default: 1, serial)'
+    )
+    parser.add_argument(
+        '--background-export',
+        action='store_true',
+        help='Serial runs only: write chart PDFs on a background thread while the next component is built'
+    )
 
     args = parser.parse_args()
 
@@ -155,6 +244,10 @@ def main():
     db = Database()
     registry = get_registry()
 
+    # Chart PDFs render on a background writer while the next component is built
+    # (serial runs only; worker processes export synchronously)
+    background_export = args.background_export and args.workers <= 1
+
     try:
         # Get manager and program from database
         manager = db.fetch_one(
@@ -246,6 +339,24 @@ def main():
         if 'components' not in manifest:
             manifest['components'] = {}
 
+        def record_generated(component_id, version, filename, variant, benchmarks):
+            stats['generated'] += 1
+            manifest['components'][filename] = {
+                'component_id': component_id,
+                'variant': variant,
+                'benchmarks': benchmarks,
+                'generated_date': datetime.now().isoformat(),
+                'data_hash': current_data_hash,
+                'code_version': version
+            }
+
+        # Jobs deferred to worker processes when --workers > 1
+        batch_jobs = []
+
+        # Files handed to the background writer, confirmed once it has finished
+        background_jobs = []
+        register_components.set_background_pdf_exports(background_export)
+
         # Generate each component
         for component in components:
             print(f"[{component.category.upper()}] {component.name} ({component.id})")
@@ -282,6 +393,14 @@ def main():
                         component.version,
                         force=args.force
                     ):
+                        if args.workers > 1:
+                            print(f"  Queued: {filename}")
+                            batch_jobs.append((
+                                component.id, manager_slug, program_slug, program_id, output_dir,
+                                variant, benchmarks if benchmarks else None
+                            ))
+                            continue
+
                         # Generate
                         print(f"  Generating: {filename}... ", end='')
                         filename, success, message = generate_component_file(
@@ -295,19 +414,14 @@ def main():
                             benchmarks=benchmarks if benchmarks else None
                         )
 
-                        if success:
+                        if success and background_export:
+                            print("[QUEUED]")
+                            background_jobs.append((
+                                output_path, component.id, component.version, filename, variant, benchmarks
+                            ))
+                        elif success:
                             print("[OK]")
-                            stats['generated'] += 1
-
-                            # Update manifest
-                            manifest['components'][filename] = {
-                                'component_id': component.id,
-                                'variant': variant,
-                                'benchmarks': benchmarks,
-                                'generated_date': datetime.now().isoformat(),
-                                'data_hash': current_data_hash,
-                                'code_version': component.version
-                            }
+                            record_generated(component.id, component.version, filename, variant, benchmarks)
                         else:
                             print(f"[FAILED] {message}")
                             stats['failed'] += 1
@@ -316,6 +430,35 @@ def main():
                         print(f"  Cached: {filename}")
                         stats['cached'] += 1
 
+        # Render queued jobs in parallel worker processes
+        if batch_jobs:
+            print()
+            print(f"Generating {len(batch_jobs)} files in {args.workers} worker processes...")
+            for job, filename, success, message in generate_batch(str(db.db_path), batch_jobs, args.workers):
+                component = registry.get(job[0])
+                if success:
+                    print(f"  Generated: {filename} [OK]")
+                    record_generated(component.id, component.version, filename, job[5], job[6] or [])
+                else:
+                    print(f"  Generated: {filename} [FAILED] {message}")
+                    stats['failed'] += 1
+
+        # Wait for background chart exports; only files that were written count as generated
+        if background_jobs:
+            print()
+            print(f"Waiting for {len(background_jobs)} background exports...")
+            failures = {Path(path): error for path, error in register_components.wait_for_pdf_exports()}
+            for output_path, component_id, version, filename, variant, benchmarks in background_jobs:
+                error = failures.get(Path(output_path))
+                if error is None and not Path(output_path).exists():
+                    error = "output file was not written"
+                if error is None:
+                    print(f"  Exported: {filename} [OK]")
+                    record_generated(component_id, version, filename, variant, benchmarks)
+                else:
+                    print(f"  Exported: {filename} [FAILED] {error}")
+                    stats['failed'] += 1
+
         # Save updated manifest
         save_manifest(output_dir, manifest)
 
@@ -342,6 +485,10 @@ def main():
         return 1
 
     finally:
+        if background_export:
+            # Leave no writes pending and restore synchronous export for later callers
+            register_components.wait_for_pdf_exports()
+            register_components.set_background_pdf_exports(False)
         db.close()
 
 
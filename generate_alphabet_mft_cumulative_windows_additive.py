@@ -74,7 +74,12 @@ def generate_non_overlapping_windows(start_date: date, end_date: date, window_ye
 
 
 def generate_additive_chart(db, program_id, windows, benchmark_market_id, starting_nav, output_path, title, subtitle):
-    """Generate cumulative windows overlay chart using additive returns."""
+    """
+    Generate cumulative windows overlay chart using additive returns.
+
+    Args:
+        windows: List of WindowDefinition objects (borrowed_data_* dates mark borrowed tails)
+    """
 
     # Color palette for windows
     colors = [
@@ -91,14 +96,14 @@ def generate_additive_chart(db, program_id, windows, benchmark_market_id, starti
     fig = go.Figure()
 
     for i, window in enumerate(windows):
-        start_date = window['start_date']
-        end_date = window['end_date']
-        window_name = window.get('name', f"{start_date} to {end_date}")
+        start_date = window.start_date
+        end_date = window.end_date
+        window_name = f"{start_date.isoformat()} to {end_date.isoformat()}"
         color = colors[i % len(colors)]
 
         # Check if this window has borrowed data
-        borrowed_start = window.get('borrowed_start_date')
-        borrowed_end = window.get('borrowed_end_date')
+        borrowed_start = window.borrowed_data_start_date
+        borrowed_end = window.borrowed_data_end_date
         has_borrowed = borrowed_start is not None and borrowed_end is not None
 
         # Get program returns
@@ -326,20 +331,8 @@ def main():
             borrow_mode=True
         )
 
-        # Convert WindowDefinition objects to dict format for existing chart code
-        windows = []
-        for wd in window_defs:
-            window_dict = {
-                'start_date': wd.start_date,
-                'end_date': wd.end_date,
-                'name': f"{wd.start_date.strftime('%Y-%m-%d')} to {wd.end_date.strftime('%Y-%m-%d')}",
-                'borrowed_start_date': wd.borrowed_data_start_date,
-                'borrowed_end_date': wd.borrowed_data_end_date
-            }
-            windows.append(window_dict)
-
-        print(f"Generated {len(windows)} windows:")
-        for i, window in enumerate(windows, 1):
+        print(f"Generated {len(window_defs)} windows:")
+        for i, window in enumerate(window_defs, 1):
             trading_days_query = db.fetch_one("""
                 SELECT COUNT(DISTINCT date) as days
                 FROM pnl_records
@@ -347,12 +340,12 @@ def main():
                   AND resolution = 'daily'
                   AND date >= ?
                   AND date <= ?
-            """, (program_id, window['start_date'].strftime('%Y-%m-%d'), window['end_date'].strftime('%Y-%m-%d')))
+            """, (program_id, window.start_date.isoformat(), window.end_date.isoformat()))
             trading_days = trading_days_query['days'] if trading_days_query else 0
             borrowed_info = ""
-            if window['borrowed_start_date'] and window['borrowed_end_date']:
-                borrowed_info = f" [BORROWED: {window['borrowed_start_date'].strftime('%Y-%m-%d')} to {window['borrowed_end_date'].strftime('%Y-%m-%d')}]"
-            print(f"  {i}. {window['name']} ({trading_days} trading days){borrowed_info}")
+            if window.borrowed_data_start_date and window.borrowed_data_end_date:
+                borrowed_info = f" [BORROWED: {window.borrowed_data_start_date.isoformat()} to {window.borrowed_data_end_date.isoformat()}]"
+            print(f"  {i}. {window.start_date.isoformat()} to {window.end_date.isoformat()} ({trading_days} trading days){borrowed_info}")
 
         # Create output directory
         output_dir = 'export'
@@ -369,7 +362,7 @@ def main():
         fig = generate_additive_chart(
             db=db,
             program_id=program_id,
-            windows=windows,
+            windows=window_defs,
             benchmark_market_id=benchmark_id,
             starting_nav=starting_nav,
             output_path=output_path,
@@ -379,7 +372,7 @@ def main():
 
         print(f"\n[OK] Chart generated successfully!")
         print(f"  Output: {output_path}")
-        print(f"  Windows: {len(windows)}")
+        print(f"  Windows: {len(window_defs)}")
         print(f"  Starting NAV: ${starting_nav:,.0f}")
         print(f"  Calculation: Additive (non-compounded)")
 
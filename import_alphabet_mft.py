@@ -16,6 +16,7 @@ Starting NAV: 1000
 import csv
 from datetime import datetime
 from database import Database
+from query_by_sector import refresh_pnl_sector_daily
 
 
 def parse_date(date_str):
@@ -95,6 +96,7 @@ def import_alphabet_mft():
                 # Delete existing pnl_records first (due to foreign key constraint)
                 program_id = program['id']
                 db.execute("DELETE FROM pnl_records WHERE program_id = ?", (program_id,))
+                refresh_pnl_sector_daily(db, program_id)
                 db.execute("DELETE FROM programs WHERE id = ?", (program_id,))
                 print(f"   [OK] Deleted existing program and its PnL records")
             else:
@@ -189,6 +191,9 @@ def import_alphabet_mft():
         )
         print(f"   [OK] Inserted {len(pnl_records)} records")
 
+        # Rebuild sector summary for the freshly imported records
+        refresh_pnl_sector_daily(db, program_id)
+
         # Step 6: Update program starting_date
         first_date = min(row[0] for row in pnl_records)
         db.execute(
@@ -14,7 +14,9 @@ Fund parameters:
 
 import csv
 from datetime import datetime, date
+from functools import lru_cache
 from database import Database
+from query_by_sector import refresh_pnl_sector_daily
 
 # Configuration
 FUND_SIZE = 10_000_000
@@ -33,15 +35,26 @@ MARKET_NAMES = [
 ]
 
 
+@lru_cache(maxsize=None)
 def parse_date(date_str):
-    """Parse DD/MM/YYYY format to YYYY-MM-DD."""
+    """
+    Parse DD/MM/YYYY format to YYYY-MM-DD.
+
+    Four-digit years are split by hand (strptime is slow per row); DD/MM/YY and
+    anything else falls back to strptime. Cached because the market and
+    benchmark CSVs repeat the same dates.
+    """
+    try:
+        day, month, year = date_str.strip().split('/')
+        if len(year) == 4:
+            return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        pass
     try:
         dt = datetime.strptime(date_str.strip(), '%d/%m/%Y')
-        return dt.strftime('%Y-%m-%d')
     except ValueError:
-        # Try alternate format
         dt = datetime.strptime(date_str.strip(), '%d/%m/%y')
-        return dt.strftime('%Y-%m-%d')
+    return dt.strftime('%Y-%m-%d')
 
 
 def parse_pnl(pnl_str):
@@ -229,6 +242,9 @@ def main():
         # Import benchmark data
         benchmark_count = import_benchmark_data(db, program_id)
 
+        # Rebuild sector summary for the freshly imported records
+        refresh_pnl_sector_daily(db, program_id)
+
         # Summary
         print("\n=== Import Summary ===")
         print(f"MFT Market Records: {mft_count}")
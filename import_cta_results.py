@@ -11,6 +11,7 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 from datetime import datetime
 from database import Database
+from query_by_sector import refresh_pnl_sector_daily
 
 
 def parse_fund_size_from_folder(folder_name):
@@ -258,6 +259,11 @@ def import_folder(db, folder_path, manager_name="Rise Capital Management", progr
                     records_inserted += 1
 
             print(f"  Inserted {records_inserted} P&L records")
+
+            # Rebuild sector summary for the freshly imported records
+            if records_inserted:
+                refresh_pnl_sector_daily(db, program_id)
+
             return records_inserted
 
     print(f"No equity curve data found in any HTML files")
@@ -9,6 +9,7 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 from datetime import datetime
 from database import Database
+from query_by_sector import refresh_pnl_sector_daily
 
 
 def parse_fund_size_from_folder(folder_name):
@@ -306,6 +307,10 @@ def import_folder_v2(db, folder_path, manager_name="Rise Capital Management", pr
         )
         print(f"  Updated program with starting NAV: ${starting_nav:,.0f} on {starting_date.strftime('%Y-%m-%d')}")
 
+    # Rebuild sector summary for the freshly imported records
+    if total_records:
+        refresh_pnl_sector_daily(db, program_id)
+
     return total_records
 
 
@@ -474,6 +479,10 @@ def import_benchmarks(db, base_dir):
         print(f"  {market_name:20} {records_inserted:4} records  ({start_date.strftime('%Y-%m-%d')} to {returns_data[-1][0].strftime('%Y-%m-%d')})")
         total_records += records_inserted
 
+    # Rebuild sector summary for the freshly imported records
+    if total_records:
+        refresh_pnl_sector_daily(db, benchmarks_program_id)
+
     return total_records
 
 
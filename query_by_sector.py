@@ -7,6 +7,7 @@ Usage examples:
 - Calculate sector-level statistics
 """
 
+import sqlite3
 from database import Database
 from datetime import date
 
@@ -67,39 +68,114 @@ def get_markets_in_sector(db, sector_name, grouping_name='mft_sector'):
     return [(m['id'], m['name']) for m in markets]
 
 
+def refresh_pnl_sector_daily(db, program_id=None):
+    """
+    Rebuild the pnl_sector_daily summary table from pnl_records.
+
+    Collapses market-level records to one row per (program, sector, date) so
+    sector aggregation no longer has to join and scan every market record.
+    Call after importing data or changing market_sector_mapping.
+
+    Args:
+        db: Database connection
+        program_id: Program to rebuild. Rebuilds all programs if None.
+    """
+    program_filter = ""
+    params = ()
+    if program_id is not None:
+        program_filter = "WHERE pr.program_id = ?"
+        params = (program_id,)
+        db.execute("DELETE FROM pnl_sector_daily WHERE program_id = ?", params)
+    else:
+        db.execute("DELETE FROM pnl_sector_daily")
+    db.execute(f"""
+        INSERT INTO pnl_sector_daily
+            (program_id, sector_id, date, return_sum, min_return, max_return,
+             positive_count, record_count)
+        SELECT
+            pr.program_id,
+            msm.sector_id,
+            pr.date,
+            SUM(pr.return),
+            MIN(pr.return),
+            MAX(pr.return),
+            SUM(CASE WHEN pr.return > 0 THEN 1 ELSE 0 END),
+            COUNT(*)
+        FROM pnl_records pr
+        JOIN market_sector_mapping msm ON pr.market_id = msm.market_id
+        {program_filter}
+        GROUP BY pr.program_id, msm.sector_id, pr.date
+    """, params)
+
+
+def _ensure_pnl_sector_daily(db, program_id):
+    """
+    Build the sector summary for a program if it has not been built yet.
+
+    Only covers the never-built case; scripts that write pnl_records or
+    market_sector_mapping call refresh_pnl_sector_daily() themselves.
+    """
+    try:
+        row = db.fetch_one(
+            "SELECT 1 FROM pnl_sector_daily WHERE program_id = ? LIMIT 1",
+            (program_id,)
+        )
+    except sqlite3.OperationalError:
+        # Older database created before pnl_sector_daily existed
+        db.initialize_schema()
+        row = None
+
+    if row is None:
+        refresh_pnl_sector_daily(db, program_id)
+
+
 def aggregate_pnl_by_sector(db, program_id, start_date=None, end_date=None, grouping_name='mft_sector'):
     """Aggregate PnL data by sector for a given program and date range."""
     print(f"\n=== Sector Aggregation (program_id={program_id}, grouping='{grouping_name}') ===\n")
 
-    # Build date filter
-    date_filter = ""
-    params = [program_id, grouping_name]
+    _ensure_pnl_sector_daily(db, program_id)
+
+    # Build date filters (summary rows for the main query, raw records for market counts)
+    summary_date_filter = ""
+    records_date_filter = ""
+    date_params = []
 
     if start_date:
-        date_filter += " AND pr.date >= ?"
-        params.append(start_date)
+        summary_date_filter += " AND psd.date >= ?"
+        records_date_filter += " AND pr.date >= ?"
+        date_params.append(start_date)
     if end_date:
-        date_filter += " AND pr.date <= ?"
-        params.append(end_date)
+        summary_date_filter += " AND psd.date <= ?"
+        records_date_filter += " AND pr.date <= ?"
+        date_params.append(end_date)
 
-    # Query sector-level aggregates
+    params = [program_id, *date_params, program_id, grouping_name, *date_params]
+
+    # Query sector-level aggregates from the per-day summary
     query = f"""
         SELECT
             s.sector_name,
-            COUNT(DISTINCT pr.date) as trading_days,
-            COUNT(DISTINCT m.id) as market_count,
-            AVG(pr.return) as avg_daily_return,
-            MIN(pr.return) as min_return,
-            MAX(pr.return) as max_return,
-            SUM(CASE WHEN pr.return > 0 THEN 1 ELSE 0 END) as positive_days
-        FROM pnl_records pr
-        JOIN markets m ON pr.market_id = m.id
-        JOIN market_sector_mapping msm ON m.id = msm.market_id
-        JOIN sectors s ON msm.sector_id = s.id
-        WHERE pr.program_id = ?
+            COUNT(psd.date) as trading_days,
+            (SELECT COUNT(*)
+             FROM market_sector_mapping msm
+             WHERE msm.sector_id = s.id
+               AND EXISTS (
+                   SELECT 1 FROM pnl_records pr
+                   WHERE pr.market_id = msm.market_id
+                     AND pr.program_id = ?
+                     {records_date_filter}
+               )
+            ) as market_count,
+            SUM(psd.return_sum) / SUM(psd.record_count) as avg_daily_return,
+            MIN(psd.min_return) as min_return,
+            MAX(psd.max_return) as max_return,
+            SUM(psd.positive_count) as positive_days
+        FROM pnl_sector_daily psd
+        JOIN sectors s ON psd.sector_id = s.id
+        WHERE psd.program_id = ?
           AND s.grouping_name = ?
-          {date_filter}
-        GROUP BY s.sector_name
+          {summary_date_filter}
+        GROUP BY s.id, s.sector_name
         ORDER BY s.sector_name
     """
 
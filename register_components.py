@@ -5,58 +5,235 @@ This module contains fully implemented component wrappers for charts, tables, an
 All components conform to the standardized interface for batch generation.
 """
 
-from component_registry import register_component
-from components.cumulative_windows_overlay import (
-    get_daily_returns_for_window,
-    get_benchmark_returns_for_window,
-    calculate_cumulative_nav,
-    calculate_cumulative_nav_additive
-)
-from components.pdf_tables import (
-    create_windows_performance_table_pdf,
-    create_summary_statistics_table_pdf
-)
-from components.event_probability_chart import render_event_probability_chart_pair
-from components.rolling_statistics_chart import (
-    generate_rolling_statistic_chart,
-    calculate_cagr_statistic,
-    calculate_annualized_return_statistic
-)
-from components.yearly_fees_summary import generate_yearly_fees_summary
-from components.detailed_fees_excel import generate_detailed_fees_excel
-from windows import (
-    generate_window_definitions_non_overlapping_reverse,
-    compute_statistics,
-    WindowDefinition,
-    Window,
-    generate_x_values,
-    compute_event_probability_analysis
-)
-import plotly.graph_objects as go
-from database import Database
+from component_registry import get_registry, register_component
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-import pandas as pd
+from functools import lru_cache, partial
+import math
+
+# Annualization factor for daily Sharpe ratios (261 trading days per year)
+_SQRT_261 = math.sqrt(261)
+
+# Window colors for multi-window charts (cycled when there are more windows)
+_WINDOW_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b')
+
+# Heavy dependencies (pandas, plotly, reportlab, windows, component modules) are
+# imported inside the functions that use them, so importing this module just to
+# populate the registry (e.g. list_components.py) stays fast.
+
+
+@lru_cache(maxsize=None)
+def configure_kaleido_scope():
+    """
+    Configure the shared Kaleido scope once per process.
+
+    Every chart export then reuses the same renderer subprocess instead of paying
+    the Chromium startup cost per chart. The scope is None when kaleido is not
+    installed, and plotly >= 6 (kaleido v1) has no scope at all.
+    """
+    import plotly.io as pio
+
+    scope = getattr(pio.kaleido, 'scope', None)
+    if scope is not None:
+        scope.default_format = 'pdf'
+        scope.default_width = 1400
+        scope.default_height = 800
+
+
+# Background PDF export: when enabled, chart functions hand the finished figure
+# to a single writer thread and return immediately, so the next figure is built
+# while Kaleido renders the previous one. One worker keeps Kaleido's single
+# renderer process strictly serial.
+_background_pdf_exports = False
+_pdf_executor = None
+_pending_pdf_exports = []
+
+
+def set_background_pdf_exports(enabled):
+    """
+    Enable or disable background chart PDF export.
+
+    When enabled, callers must call wait_for_pdf_exports() before relying on the
+    output files (e.g. before writing a manifest).
+    """
+    global _background_pdf_exports
+    _background_pdf_exports = enabled
+
+
+def wait_for_pdf_exports():
+    """
+    Block until all background chart exports have finished.
+
+    Returns:
+        List of (output_path, exception) for exports that failed
+    """
+    failures = []
+    while _pending_pdf_exports:
+        output_path, future = _pending_pdf_exports.pop(0)
+        error = future.exception()
+        if error is not None:
+            failures.append((output_path, error))
+    return failures
+
+
+def _write_chart_pdf(fig, output_path, **size):
+    """
+    Export fig to PDF through the shared Kaleido scope.
+
+    Args:
+        fig: Plotly figure
+        output_path: Destination PDF path
+        **size: Optional width/height overriding the scope defaults (1400x800)
+    """
+    global _pdf_executor
+    configure_kaleido_scope()
+
+    if not _background_pdf_exports:
+        fig.write_image(output_path, **size)
+        return
+
+    if _pdf_executor is None:
+        _pdf_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-export')
+    future = _pdf_executor.submit(fig.write_image, output_path, **size)
+    _pending_pdf_exports.append((output_path, future))
+
+
+# =============================================================================
+# Shared Data Access Helpers
+# =============================================================================
+
+# Memos shared by every component run against the same Database instance, as
+# (Database.cache() name, max entries). The database empties them once its data
+# may have changed.
+_PROGRAM_META_CACHE = ('components.program_meta', 1024)
+_BENCHMARK_IDS_CACHE = ('components.benchmark_ids', 1)
+_DAILY_SERIES_CACHE = ('components.daily_series', 32)
+_WINDOW_STATS_CACHE = ('components.window_stats', 128)
+
+
+def _memoized(db, cache, key, compute):
+    """Return key's entry in db's cache (name, maxsize), calling compute() on a miss."""
+    cache = db.cache(*cache)
+    if key not in cache:
+        cache[key] = compute()
+    return cache[key]
+
+
+def clear_component_caches(db):
+    """Drop all cached program metadata, benchmark IDs, daily series, window definitions, window statistics and Window series."""
+    db.clear_caches()
+    _get_reverse_window_defs.cache_clear()
+
+
+# Program row plus its daily date range; each bound is its own subquery so SQLite
+# can answer it from the index
+_PROGRAM_META_SQL = """
+    SELECT p.id, p.program_name, p.fund_size, p.starting_nav, p.starting_date,
+           m.manager_name,
+           (SELECT MIN(date) FROM pnl_records
+            WHERE program_id = p.id AND resolution = 'daily') as min_daily_date,
+           (SELECT MAX(date) FROM pnl_records
+            WHERE program_id = p.id AND resolution = 'daily') as max_daily_date
+    FROM programs p
+    JOIN managers m ON p.manager_id = m.id
+"""
+
+
+def _get_program_meta(db, program_id):
+    """
+    Cached program row (id, program_name, fund_size, starting_nav, starting_date,
+    manager_name, min_daily_date, max_daily_date).
+
+    Raises:
+        ValueError: If the program does not exist
+    """
+    def compute():
+        return db.fetch_one(_PROGRAM_META_SQL + " WHERE p.id = ?", (program_id,))
+
+    program = _memoized(db, _PROGRAM_META_CACHE, program_id, compute)
+    if not program:
+        raise ValueError(f"Program ID {program_id} not found")
+    return program
+
+
+def prefetch_program_meta(db, program_ids):
+    """
+    Load metadata for several programs in one query ahead of a multi-program batch.
+
+    Fills the same cache _get_program_meta() reads, so the per-component lookups
+    that follow do not touch the database. Unknown IDs are cached as missing and
+    still raise ValueError when a component asks for them.
+    """
+    program_ids = list(program_ids)
+    if not program_ids:
+        return
+
+    placeholders = ','.join('?' * len(program_ids))
+    rows = db.fetch_all(_PROGRAM_META_SQL + f" WHERE p.id IN ({placeholders})", tuple(program_ids))
+    rows_by_id = {row['id']: row for row in rows}
+
+    cache = db.cache(*_PROGRAM_META_CACHE)
+    for program_id in program_ids:
+        cache[program_id] = rows_by_id.get(program_id)
+
+
+def _get_program_daily_range(db, program_id):
+    """
+    Cached (min_date, max_date) of a program's daily records (see _get_program_meta()).
+
+    Raises:
+        ValueError: If the program does not exist or has no daily data
+    """
+    program = _get_program_meta(db, program_id)
+    if not program['min_daily_date']:
+        raise ValueError(f"No daily data found for program {program_id}")
+    return date.fromisoformat(program['min_daily_date']), date.fromisoformat(program['max_daily_date'])
+
+
+@lru_cache(maxsize=128)
+def _get_reverse_window_defs(earliest_date, latest_date, window_length_years,
+                             program_ids, benchmark_ids, window_set_name=None, borrow_mode=False):
+    """
+    Cached generate_window_definitions_non_overlapping_reverse() result.
+
+    Arguments must be hashable (program_ids/benchmark_ids as tuples). Returns a
+    tuple shared between callers, so the WindowDefinitions must not be mutated.
+    """
+    from windows import generate_window_definitions_non_overlapping_reverse
+
+    return tuple(generate_window_definitions_non_overlapping_reverse(
+        earliest_date=earliest_date,
+        latest_date=latest_date,
+        window_length_years=window_length_years,
+        program_ids=list(program_ids),
+        benchmark_ids=list(benchmark_ids),
+        window_set_name=window_set_name,
+        borrow_mode=borrow_mode
+    ))
 
 
 # =============================================================================
 # Chart Component Implementations
 # =============================================================================
 
+def _get_benchmark_ids_by_name(db):
+    """Cached {market name: id} map of every benchmark market in db."""
+    def compute():
+        rows = db.fetch_all("SELECT id, name FROM markets WHERE is_benchmark = 1")
+        return {row['name']: row['id'] for row in rows}
+
+    return _memoized(db, _BENCHMARK_IDS_CACHE, None, compute)
+
+
 def _get_benchmark_ids(db, benchmarks):
-    """Helper to convert benchmark names to IDs."""
+    """Helper to convert benchmark names to IDs (unknown names are skipped)."""
     if not benchmarks:
         return []
 
-    benchmark_ids = []
-    for bm_name in benchmarks:
-        bm = db.fetch_one(
-            "SELECT id FROM markets WHERE name = ? AND is_benchmark = 1",
-            (bm_name.upper(),)
-        )
-        if bm:
-            benchmark_ids.append(bm['id'])
+    ids_by_name = _get_benchmark_ids_by_name(db)
+    names = [bm_name.upper() for bm_name in benchmarks]
 
-    return benchmark_ids
+    return [ids_by_name[name] for name in names if name in ids_by_name]
 
 
 def _generate_cumulative_windows_chart(
@@ -68,77 +245,71 @@ def _generate_cumulative_windows_chart(
     Args:
         compounded: If True, use compounded returns. If False, use additive.
     """
-    # Get program metadata
-    program = db.fetch_one("""
-        SELECT p.id, p.program_name, p.starting_nav, m.manager_name
-        FROM programs p
-        JOIN managers m ON p.manager_id = m.id
-        WHERE p.id = ?
-    """, (program_id,))
+    import numpy as np
+    import pandas as pd
+    import plotly.graph_objects as go
+    from components.cumulative_windows_overlay import (
+        get_daily_returns_for_windows,
+        get_benchmark_returns_for_windows,
+        calculate_cumulative_nav,
+        calculate_cumulative_nav_additive
+    )
 
-    if not program:
-        raise ValueError(f"Program ID {program_id} not found")
+    # Get program metadata
+    program = _get_program_meta(db, program_id)
 
     # Get data range
-    date_range = db.fetch_one("""
-        SELECT MIN(date) as min_date, MAX(date) as max_date
-        FROM pnl_records
-        WHERE program_id = ? AND resolution = 'daily'
-    """, (program_id,))
-
-    if not date_range or not date_range['min_date']:
-        raise ValueError(f"No daily data found for program {program_id}")
-
-    min_date = date.fromisoformat(date_range['min_date'])
-    max_date = date.fromisoformat(date_range['max_date'])
+    min_date, max_date = _get_program_daily_range(db, program_id)
 
     # Get benchmark IDs
     benchmark_ids = _get_benchmark_ids(db, benchmarks)
     benchmark_id = benchmark_ids[0] if benchmark_ids else None
 
     # Generate windows with borrow_mode
-    window_defs = generate_window_definitions_non_overlapping_reverse(
-        earliest_date=min_date,
-        latest_date=max_date,
-        window_length_years=5,
-        program_ids=[program_id],
-        benchmark_ids=benchmark_ids,
-        window_set_name="5yr_non_overlapping",
-        borrow_mode=True
+    window_defs = _get_reverse_window_defs(
+        min_date, max_date, 5, (program_id,), tuple(benchmark_ids),
+        window_set_name="5yr_non_overlapping", borrow_mode=True
     )
 
-    # Color palette
-    colors_palette = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
+    # Fetch every window's returns in one query per series
+    window_ranges = [(wd.start_date, wd.end_date) for wd in window_defs]
+    program_dfs = get_daily_returns_for_windows(db, program_id, window_ranges)
+    if benchmark_id:
+        benchmark_dfs = get_benchmark_returns_for_windows(db, benchmark_id, window_ranges)
+    else:
+        benchmark_dfs = []
 
-    fig = go.Figure()
+    # One x-axis array (day 0 + longest series), sliced per trace
+    xs = np.arange(max((len(df) for df in program_dfs + benchmark_dfs), default=0) + 1)
 
-    for i, wd in enumerate(window_defs):
-        color = colors_palette[i % len(colors_palette)]
+    # Collect traces and build the figure once rather than add_trace per segment
+    traces = []
 
-        # Get program returns
-        program_df = get_daily_returns_for_window(
-            db, program_id, wd.start_date, wd.end_date
-        )
+    for i, wd in enumerate(window_defs):
+        color = _WINDOW_COLORS[i % len(_WINDOW_COLORS)]
+        program_df = program_dfs[i]
 
         if len(program_df) == 0:
             continue
 
         # Calculate NAV curve
         calc_func = calculate_cumulative_nav if compounded else calculate_cumulative_nav_additive
-        nav_curve = calc_func(program_df['return'].tolist(), program['starting_nav'])
-        trading_days = list(range(len(nav_curve)))
+        nav_curve = calc_func(program_df['return'].to_numpy(), program['starting_nav'])
+        trading_days = xs[:len(nav_curve)]
 
-        window_name = f"{wd.start_date.strftime('%Y-%m-%d')} to {wd.end_date.strftime('%Y-%m-%d')}"
+        window_name = f"{wd.start_date.isoformat()} to {wd.end_date.isoformat()}"
 
         # Check for borrowed data
         has_borrowed = wd.borrowed_data_start_date is not None
+        borrowed_ts = pd.Timestamp(wd.borrowed_data_start_date) if has_borrowed else None
 
         if has_borrowed:
             # Split into actual and borrowed segments
-            borrowed_start_idx = len(program_df[program_df['date'] < pd.Timestamp(wd.borrowed_data_start_date)])
+            # Dates are sorted, so a binary search gives the count of dates before borrowed_ts
+            borrowed_start_idx = int(program_df['date'].searchsorted(borrowed_ts))
 
             # Actual segment (solid)
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=trading_days[:borrowed_start_idx],
                 y=nav_curve[:borrowed_start_idx],
                 mode='lines',
@@ -149,7 +320,7 @@ def _generate_cumulative_windows_chart(
             ))
 
             # Borrowed segment (dotted)
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=trading_days[borrowed_start_idx-1:],
                 y=nav_curve[borrowed_start_idx-1:],
                 mode='lines',
@@ -160,7 +331,7 @@ def _generate_cumulative_windows_chart(
             ))
         else:
             # Single trace
-            fig.add_trace(go.Scatter(
+            traces.append(go.Scatter(
                 x=trading_days,
                 y=nav_curve,
                 mode='lines',
@@ -172,19 +343,17 @@ def _generate_cumulative_windows_chart(
 
         # Add benchmark if provided
         if benchmark_id:
-            benchmark_df = get_benchmark_returns_for_window(
-                db, benchmark_id, wd.start_date, wd.end_date
-            )
+            benchmark_df = benchmark_dfs[i]
 
             if len(benchmark_df) > 0:
-                benchmark_nav = calc_func(benchmark_df['return'].tolist(), program['starting_nav'])
-                benchmark_days = list(range(len(benchmark_nav)))
+                benchmark_nav = calc_func(benchmark_df['return'].to_numpy(), program['starting_nav'])
+                benchmark_days = xs[:len(benchmark_nav)]
 
                 if has_borrowed:
-                    borrowed_start_idx = len(benchmark_df[benchmark_df['date'] < pd.Timestamp(wd.borrowed_data_start_date)])
+                    borrowed_start_idx = int(benchmark_df['date'].searchsorted(borrowed_ts))
 
                     # Actual (dashed)
-                    fig.add_trace(go.Scatter(
+                    traces.append(go.Scatter(
                         x=benchmark_days[:borrowed_start_idx],
                         y=benchmark_nav[:borrowed_start_idx],
                         mode='lines',
@@ -195,7 +364,7 @@ def _generate_cumulative_windows_chart(
                     ))
 
                     # Borrowed (dotted)
-                    fig.add_trace(go.Scatter(
+                    traces.append(go.Scatter(
                         x=benchmark_days[borrowed_start_idx-1:],
                         y=benchmark_nav[borrowed_start_idx-1:],
                         mode='lines',
@@ -205,7 +374,7 @@ def _generate_cumulative_windows_chart(
                         showlegend=False
                     ))
                 else:
-                    fig.add_trace(go.Scatter(
+                    traces.append(go.Scatter(
                         x=benchmark_days,
                         y=benchmark_nav,
                         mode='lines',
@@ -225,6 +394,7 @@ def _generate_cumulative_windows_chart(
         benchmark_desc = ""
     subtitle = f"Starting NAV: ${program['starting_nav']:,.0f}. {calc_type} returns. Solid: Strategy.{benchmark_desc} Dotted: Borrowed data."
 
+    fig = go.Figure(data=traces)
     fig.update_layout(
         title={'text': title, 'x': 0.5, 'xanchor': 'center', 'font': {'size': 20}},
         xaxis_title='Trading Days Since Window Start',
@@ -245,8 +415,8 @@ def _generate_cumulative_windows_chart(
             showarrow=False, font=dict(size=12, color='gray')
         )
 
-    # Save
-    fig.write_image(output_path, format='pdf', width=1400, height=800)
+    # Save (size passed explicitly; the scope defaults are not set on every Kaleido version)
+    _write_chart_pdf(fig, output_path, width=1400, height=800)
     return fig
 
 
@@ -286,7 +456,7 @@ def generate_equity_curve_full_history(db, program_id, output_path, benchmarks=N
     )
 
     # Save to PDF
-    fig.write_image(output_path, format='pdf', width=1200, height=700)
+    _write_chart_pdf(fig, output_path, width=1200, height=700)
     return fig
 
 
@@ -315,29 +485,19 @@ def generate_event_probability_analysis(db, program_id, output_path, benchmarks=
     Returns:
         Tuple of (short_range_path, long_range_path)
     """
-    # Get program metadata
-    program = db.fetch_one("""
-        SELECT p.id, p.program_name, p.fund_size, m.manager_name
-        FROM programs p
-        JOIN managers m ON p.manager_id = m.id
-        WHERE p.id = ?
-    """, (program_id,))
+    from components.event_probability_chart import render_event_probability_chart_pair
+    from windows import (
+        WindowDefinition,
+        Window,
+        generate_x_values,
+        compute_event_probability_analysis
+    )
 
-    if not program:
-        raise ValueError(f"Program ID {program_id} not found")
+    # Get program metadata
+    program = _get_program_meta(db, program_id)
 
     # Get data range
-    date_range = db.fetch_one("""
-        SELECT MIN(date) as min_date, MAX(date) as max_date
-        FROM pnl_records
-        WHERE program_id = ? AND resolution = 'daily'
-    """, (program_id,))
-
-    if not date_range or not date_range['min_date']:
-        raise ValueError(f"No daily data found for program {program_id}")
-
-    min_date = date.fromisoformat(date_range['min_date'])
-    max_date = date.fromisoformat(date_range['max_date'])
+    min_date, max_date = _get_program_daily_range(db, program_id)
 
     # Create full-history window
     window_def = WindowDefinition(
@@ -385,214 +545,243 @@ def generate_event_probability_analysis(db, program_id, output_path, benchmarks=
 
 
 # =============================================================================
-# Rolling CAGR Chart Component Wrappers
+# Rolling Statistic Chart Components (CAGR and Annualized Return)
 # =============================================================================
 
-def generate_rolling_cagr_1month(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 1-month rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=1,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+# Rolling window variants shared by the CAGR and annualized return charts:
+# (id suffix, length, unit). Each pair registers one component per statistic.
+_ROLLING_WINDOW_SPECS = (
+    ('1month', 1, 'month'),
+    ('2month', 2, 'month'),
+    ('3month', 3, 'month'),
+    ('6month', 6, 'month'),
+    ('1year', 1, 'year'),
+    ('2year', 2, 'year'),
+    ('3year', 3, 'year'),
+    ('5year', 5, 'year'),
+    ('10year', 10, 'year'),
+)
 
+# Rolling statistics: id prefix -> (display name, calculator in
+# components.rolling_statistics_chart, description suffix)
+_ROLLING_STATISTICS = {
+    'rolling_cagr': ('CAGR', 'calculate_cagr_statistic', 'CAGR with 1-day slide intervals'),
+    'rolling_annualized_return': (
+        'Annualized Return', 'calculate_annualized_return_statistic',
+        'annualized return (arithmetic mean × 261) with 1-day slide'
+    ),
+}
 
-def generate_rolling_cagr_2month(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 2-month rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=2,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
 
+def _generate_rolling_statistic(db, program_id, output_path, benchmarks=None, variant=None, *,
+                                window_months, statistic, **kwargs):
+    """
+    Generate a rolling statistic chart (1-day slide).
 
-def generate_rolling_cagr_3month(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 3-month rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=3,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+    Registered once per _ROLLING_WINDOW_SPECS x _ROLLING_STATISTICS entry with
+    window_months and statistic bound via functools.partial.
 
+    Args:
+        window_months: Rolling window length in months
+        statistic: Key into _ROLLING_STATISTICS (e.g. 'rolling_cagr')
+    """
+    from components import rolling_statistics_chart as rsc
 
-def generate_rolling_cagr_6month(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 6-month rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=6,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
+    statistic_name, calculator_name, _ = _ROLLING_STATISTICS[statistic]
+    return rsc.generate_rolling_statistic_chart(
+        db, program_id, output_path, window_months=window_months,
+        statistic_calculator=getattr(rsc, calculator_name),
+        statistic_name=statistic_name,
         y_axis_label="Annualized Return (%)",
         benchmarks=benchmarks, **kwargs
     )
 
 
-def generate_rolling_cagr_1year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 1-year rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=12,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
-
+def _register_rolling_statistic_components():
+    """Register every rolling statistic chart variant from the spec tables."""
+    for statistic, (statistic_name, _, description) in _ROLLING_STATISTICS.items():
+        for suffix, length, unit in _ROLLING_WINDOW_SPECS:
+            window_months = length * 12 if unit == 'year' else length
+            register_component(
+                id=f'{statistic}_{suffix}',
+                name=f'Rolling {statistic_name} ({length}-{unit.capitalize()})',
+                category='chart',
+                description=f'{length}-{unit} rolling {description}',
+                function=partial(_generate_rolling_statistic,
+                                 window_months=window_months, statistic=statistic),
+                benchmark_support=True,
+                benchmark_combinations=[[], ['sp500'], ['areit']],
+                version='1.0.0'
+            )
 
-def generate_rolling_cagr_2year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 2-year rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=24,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
 
+# =============================================================================
+# Table Component Implementations
+# =============================================================================
 
-def generate_rolling_cagr_3year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 3-year rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=36,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+def _get_daily_series(db, program_id):
+    """
+    Cached (dates, rets, cumlog, prefix_sum, prefix_sqsum) for a program's daily series.
 
+    cumlog is the log-growth prefix sum used by _window_stats_row(); prefix_sum and
+    prefix_sqsum are the plain and squared return prefix sums used to get every
+    window's daily std dev and Sharpe in one pass (_window_sharpe_arrays()).
+    """
+    import numpy as np
 
-def generate_rolling_cagr_5year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 5-year rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=60,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+    def compute():
+        dates, rets = _fetch_daily_returns_array(db, program_id)
+        cumlog = np.concatenate(([0.0], np.cumsum(np.log1p(rets))))
+        prefix_sum = np.concatenate(([0.0], np.cumsum(rets)))
+        prefix_sqsum = np.concatenate(([0.0], np.cumsum(rets * rets)))
+        return dates, rets, cumlog, prefix_sum, prefix_sqsum
 
+    return _memoized(db, _DAILY_SERIES_CACHE, program_id, compute)
 
-def generate_rolling_cagr_10year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 10-year rolling CAGR chart (1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=120,
-        statistic_calculator=calculate_cagr_statistic,
-        statistic_name="CAGR",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
 
+def _get_window_stats_rows(db, program_id, starts, ends, borrowed):
+    """
+    Cached windows-table rows for program_id.
 
-# =============================================================================
-# Rolling Annualized Return Chart Component Wrappers
-# =============================================================================
+    Args:
+        starts, ends: datetime64[D] arrays of row start/end dates (inclusive)
+        borrowed: bool array flagging rows that include borrowed data
+    """
+    def compute():
+        return _window_stats_rows(_get_daily_series(db, program_id), starts, ends, borrowed)
 
-def generate_rolling_annualized_return_1month(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 1-month rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=1,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+    key = (program_id, starts.tobytes(), ends.tobytes(), borrowed.tobytes())
+    return [dict(row) for row in _memoized(db, _WINDOW_STATS_CACHE, key, compute)]
 
 
-def generate_rolling_annualized_return_2month(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 2-month rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=2,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+def _fetch_daily_returns_array(db, program_id):
+    """
+    Fetch a program's full daily return series as NumPy arrays.
 
+    Returns are summed across non-benchmark markets per date, matching
+    Window.get_manager_daily_data().
 
-def generate_rolling_annualized_return_3month(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 3-month rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=3,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+    Returns:
+        Tuple of (dates as datetime64[D] array, returns as float64 array), sorted by date
+    """
+    import numpy as np
 
+    rows = db.fetch_all("""
+        SELECT pr.date, SUM(pr.return) as total_return
+        FROM pnl_records pr
+        JOIN markets m ON pr.market_id = m.id
+        WHERE pr.program_id = ?
+          AND pr.resolution = 'daily'
+          AND m.is_benchmark = 0
+        GROUP BY pr.date
+        ORDER BY pr.date
+    """, (program_id,))
 
-def generate_rolling_annualized_return_6month(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 6-month rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=6,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+    if not rows:
+        return np.array([], dtype='datetime64[D]'), np.array([], dtype=np.float64)
 
+    dates, rets = zip(*rows)
+    return np.array(dates, dtype='datetime64[D]'), np.array(rets, dtype=np.float64)
 
-def generate_rolling_annualized_return_1year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 1-year rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=12,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
 
+def _window_bounds(dates, starts, ends):
+    """Return (I0, I1) arrays such that dates[I0[k]:I1[k]] covers starts[k]..ends[k] inclusive."""
+    import numpy as np
 
-def generate_rolling_annualized_return_2year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 2-year rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=24,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+    I0 = np.searchsorted(dates, np.array(starts, dtype='datetime64[D]'), side='left')
+    I1 = np.searchsorted(dates, np.array(ends, dtype='datetime64[D]'), side='right')
+    return I0, I1
 
 
-def generate_rolling_annualized_return_3year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 3-year rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=36,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+def _window_sharpe_arrays(prefix_sum, prefix_sqsum, I0, I1):
+    """
+    Daily std dev (ddof=1) and Sharpe (x sqrt(261)) for every [I0[k]:I1[k]] slice at once.
 
+    Windows with a single observation get a NaN std dev, as pandas does; any window
+    without a positive std dev gets a Sharpe of 0.0.
+    """
+    import numpy as np
+
+    n = (I1 - I0).astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = (prefix_sum[I1] - prefix_sum[I0]) / n
+        sq_dev = np.maximum(prefix_sqsum[I1] - prefix_sqsum[I0] - n * means * means, 0.0)
+        stds = np.where(n > 1, np.sqrt(sq_dev / (n - 1)), np.nan)
+        sharpes = np.where(stds > 0, means / stds * _SQRT_261, 0.0)
+    return stds, sharpes
+
+
+def _window_stats_rows(series, starts, ends, borrowed):
+    """Compute windows-table rows for parallel start/end/borrowed arrays over one daily series."""
+    dates, rets, cumlog, prefix_sum, prefix_sqsum = series
+    I0, I1 = _window_bounds(dates, starts, ends)
+    stds, sharpes = _window_sharpe_arrays(prefix_sum, prefix_sqsum, I0, I1)
+
+    return [
+        _window_stats_row(dates, rets, cumlog, i0, i1, start, end, is_borrowed, std, sharpe)
+        for start, end, is_borrowed, i0, i1, std, sharpe in zip(
+            starts.tolist(), ends.tolist(), borrowed.tolist(),
+            I0.tolist(), I1.tolist(), stds.tolist(), sharpes.tolist()
+        )
+    ]
 
-def generate_rolling_annualized_return_5year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 5-year rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=60,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
 
+def _window_stats_row(dates, rets, cumlog, i0, i1, start_date, end_date, borrowed,
+                      daily_std, sharpe):
+    """
+    Compute one windows-table row for the daily slice [i0:i1].
 
-def generate_rolling_annualized_return_10year(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate 10-year rolling annualized return chart (arithmetic mean × 261, 1-day slide)."""
-    return generate_rolling_statistic_chart(
-        db, program_id, output_path, window_months=120,
-        statistic_calculator=calculate_annualized_return_statistic,
-        statistic_name="Annualized Return",
-        y_axis_label="Annualized Return (%)",
-        benchmarks=benchmarks, **kwargs
-    )
+    Produces the same figures as compute_statistics() on the daily path: mean of
+    monthly compounded returns, daily std dev, compounded max drawdown from the
+    daily NAV, CAGR from calendar days, and Sharpe from daily returns (x sqrt(261)).
 
+    cumlog is the log-growth prefix sum of the full series (cumlog[0] = 0,
+    cumlog[k] = sum(log1p(rets[:k]))), so compounded growth over any slice is
+    exp(cumlog[i1] - cumlog[i0]) without re-multiplying the returns. daily_std and
+    sharpe come precomputed for all windows from _window_sharpe_arrays().
+    """
+    import numpy as np
+
+    daily_count = i1 - i0
+    window_name = f"{start_date.isoformat()} to {end_date.isoformat()}"
+
+    if daily_count == 0:
+        return {
+            'window_name': window_name,
+            'daily_count': 0,
+            'mean_monthly': float('nan'),
+            'std_daily': 0.0,
+            'max_dd': float('nan'),
+            'sharpe': 0.0,
+            'cagr': 0.0,
+            'borrowed': borrowed
+        }
+
+    # Monthly compounded returns from the prefix sums at calendar month boundaries
+    months = dates[i0:i1].astype('datetime64[M]')
+    month_bounds = np.concatenate(([0], np.flatnonzero(months[1:] != months[:-1]) + 1, [daily_count])) + i0
+    monthly_returns = np.expm1(np.diff(cumlog[month_bounds]))
+
+    # Compounded max drawdown from the daily log-NAV curve (peak tracked from day 1)
+    log_nav = cumlog[i0 + 1:i1 + 1]
+    max_dd = float(np.expm1((log_nav - np.maximum.accumulate(log_nav)).min()))
+
+    # CAGR from calendar days
+    years = (end_date - start_date).days / 365.25
+    total_log_growth = cumlog[i1] - cumlog[i0]
+    cagr = float(np.expm1(total_log_growth / years)) if years > 0 else 0.0
+
+    return {
+        'window_name': window_name,
+        'daily_count': daily_count,
+        'mean_monthly': float(monthly_returns.mean()),
+        'std_daily': daily_std,
+        'max_dd': max_dd,
+        'sharpe': sharpe,
+        'cagr': cagr,
+        'borrowed': borrowed
+    }
 
-# =============================================================================
-# Table Component Implementations
-# =============================================================================
 
 def generate_windows_performance_table(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
     """
@@ -600,132 +789,40 @@ def generate_windows_performance_table(db, program_id, output_path, benchmarks=N
 
     Shows: Trading days, mean monthly return, daily std dev, max drawdown, Sharpe, CAGR.
     """
-    # Get program metadata
-    program = db.fetch_one("""
-        SELECT p.id, p.program_name, p.starting_nav, m.manager_name
-        FROM programs p
-        JOIN managers m ON p.manager_id = m.id
-        WHERE p.id = ?
-    """, (program_id,))
+    import numpy as np
+    from components.pdf_tables import create_windows_performance_table_pdf
 
-    if not program:
-        raise ValueError(f"Program ID {program_id} not found")
+    # Get program metadata
+    program = _get_program_meta(db, program_id)
 
     # Get data range
-    date_range = db.fetch_one("""
-        SELECT MIN(date) as min_date, MAX(date) as max_date
-        FROM pnl_records
-        WHERE program_id = ? AND resolution = 'daily'
-    """, (program_id,))
-
-    if not date_range or not date_range['min_date']:
-        raise ValueError(f"No daily data found for program {program_id}")
-
-    min_date = date.fromisoformat(date_range['min_date'])
-    max_date = date.fromisoformat(date_range['max_date'])
+    min_date, max_date = _get_program_daily_range(db, program_id)
 
     # Generate windows
-    window_defs = generate_window_definitions_non_overlapping_reverse(
-        earliest_date=min_date,
-        latest_date=max_date,
-        window_length_years=5,
-        program_ids=[program_id],
-        benchmark_ids=[],
-        borrow_mode=True
+    window_defs = _get_reverse_window_defs(min_date, max_date, 5, (program_id,), (), borrow_mode=True)
+
+    # Window bounds as parallel arrays
+    starts = np.array([wd.start_date for wd in window_defs], dtype='datetime64[D]')
+    ends = np.array([wd.end_date for wd in window_defs], dtype='datetime64[D]')
+    borrowed_starts = np.array(
+        [wd.borrowed_data_start_date or np.datetime64('NaT') for wd in window_defs],
+        dtype='datetime64[D]'
     )
-
-    # Compute statistics for each window
-    from windows import Window, WindowDefinition
-    from datetime import timedelta
-    windows_stats = []
-
-    for wd in window_defs:
-        # If window has borrowed data, create TWO rows: one without borrowed, one with
-        if wd.borrowed_data_start_date:
-            # Row 1: Non-borrowed period (actual data only)
-            non_borrowed_def = WindowDefinition(
-                start_date=wd.start_date,
-                end_date=wd.borrowed_data_start_date - timedelta(days=1),
-                program_ids=wd.program_ids,
-                benchmark_ids=wd.benchmark_ids,
-                name=f"{wd.name} (non-borrowed)"
-            )
-            non_borrowed_window = Window(non_borrowed_def, db)
-            non_borrowed_stats = compute_statistics(non_borrowed_window, program_id, entity_type='manager')
-
-            # Get daily returns for Sharpe calculation
-            daily_df_nb = non_borrowed_window.get_manager_daily_data(program_id)
-            if len(daily_df_nb) > 0:
-                daily_mean_nb = daily_df_nb['return'].mean()
-                daily_std_nb = daily_df_nb['return'].std()
-                sharpe_nb = (daily_mean_nb / daily_std_nb * (261 ** 0.5)) if daily_std_nb > 0 else 0.0
-            else:
-                daily_std_nb = 0.0
-                sharpe_nb = 0.0
-
-            # Add non-borrowed row
-            windows_stats.append({
-                'window_name': f"{non_borrowed_def.start_date.strftime('%Y-%m-%d')} to {non_borrowed_def.end_date.strftime('%Y-%m-%d')}",
-                'daily_count': non_borrowed_stats.daily_count if non_borrowed_stats.daily_count > 0 else non_borrowed_stats.count * 21,
-                'mean_monthly': non_borrowed_stats.mean,
-                'std_daily': daily_std_nb,
-                'max_dd': non_borrowed_stats.max_drawdown_compounded,
-                'sharpe': sharpe_nb,
-                'cagr': non_borrowed_stats.cagr,
-                'borrowed': False
-            })
-
-            # Row 2: Full window with borrowed data
-            full_window = Window(wd, db)
-            full_stats = compute_statistics(full_window, program_id, entity_type='manager')
-
-            daily_df_full = full_window.get_manager_daily_data(program_id)
-            if len(daily_df_full) > 0:
-                daily_mean_full = daily_df_full['return'].mean()
-                daily_std_full = daily_df_full['return'].std()
-                sharpe_full = (daily_mean_full / daily_std_full * (261 ** 0.5)) if daily_std_full > 0 else 0.0
-            else:
-                daily_std_full = 0.0
-                sharpe_full = 0.0
-
-            # Add borrowed row (with asterisk)
-            windows_stats.append({
-                'window_name': f"{wd.start_date.strftime('%Y-%m-%d')} to {wd.end_date.strftime('%Y-%m-%d')}",
-                'daily_count': full_stats.daily_count if full_stats.daily_count > 0 else full_stats.count * 21,
-                'mean_monthly': full_stats.mean,
-                'std_daily': daily_std_full,
-                'max_dd': full_stats.max_drawdown_compounded,
-                'sharpe': sharpe_full,
-                'cagr': full_stats.cagr,
-                'borrowed': True
-            })
-        else:
-            # Normal window - no borrowed data
-            window = Window(wd, db)
-            stats = compute_statistics(window, program_id, entity_type='manager')
-
-            # Get daily returns for proper Sharpe calculation
-            daily_df = window.get_manager_daily_data(program_id)
-            if len(daily_df) > 0:
-                daily_mean = daily_df['return'].mean()
-                daily_std = daily_df['return'].std()
-                sharpe = (daily_mean / daily_std * (261 ** 0.5)) if daily_std > 0 else 0.0
-            else:
-                daily_std = 0.0
-                sharpe = 0.0
-
-            window_stats = {
-                'window_name': f"{wd.start_date.strftime('%Y-%m-%d')} to {wd.end_date.strftime('%Y-%m-%d')}",
-                'daily_count': stats.daily_count if stats.daily_count > 0 else stats.count * 21,
-                'mean_monthly': stats.mean,
-                'std_daily': daily_std,
-                'max_dd': stats.max_drawdown_compounded,
-                'sharpe': sharpe,
-                'cagr': stats.cagr,
-                'borrowed': False
-            }
-
-            windows_stats.append(window_stats)
+    has_borrowed = ~np.isnat(borrowed_starts)
+
+    # A borrowed window gets TWO rows: the non-borrowed period (actual data only,
+    # ending the day before the borrowed data starts) followed by the full window
+    # with borrowed data (with asterisk)
+    rows_per_window = 1 + has_borrowed.astype(np.intp)
+    row_starts = np.repeat(starts, rows_per_window)
+    row_ends = np.repeat(ends, rows_per_window)
+    row_borrowed = np.repeat(has_borrowed, rows_per_window)
+    first_rows = (np.cumsum(rows_per_window) - rows_per_window)[has_borrowed]
+    row_ends[first_rows] = borrowed_starts[has_borrowed] - np.timedelta64(1, 'D')
+    row_borrowed[first_rows] = False
+
+    # Compute statistics for every row in one pass over the cached daily series
+    windows_stats = _get_window_stats_rows(db, program_id, row_starts, row_ends, row_borrowed)
 
     # Generate PDF table
     create_windows_performance_table_pdf(
@@ -743,95 +840,151 @@ def generate_windows_performance_table(db, program_id, output_path, benchmarks=N
 # Text Block Components
 # =============================================================================
 
+# Strategy description text, filled from the _get_program_meta() row
+_DESC_TITLE_TEMPLATE = "<b>{manager_name} - {program_name}</b>"
+
+_DESC_TEMPLATE = """
+    <b>Program:</b> {program_name}<br/>
+    <b>Fund Size:</b> ${fund_size:,.0f}<br/>
+    <b>Inception Date:</b> {starting_date}<br/><br/>
+
+    This is a systematic trading program that employs quantitative strategies
+    across multiple asset classes. The strategy focuses on risk-adjusted returns
+    through diversified market exposure and disciplined risk management.
+    """
+
+_DISCLAIMER_TEXT = """
+    <b>IMPORTANT DISCLAIMER</b><br/><br/>
+
+    Past performance is not indicative of future results. This material is for informational
+    purposes only and does not constitute investment advice or a recommendation to buy or sell
+    any security. The information contained herein has been prepared solely for informational
+    purposes and is not an offer to buy or sell or a solicitation of an offer to buy or sell
+    any security or to participate in any trading strategy.<br/><br/>
+
+    Any investment involves substantial risks, including complete loss of capital. There can
+    be no assurance that any investment strategy will be successful. All investments involve
+    risk and may lose value. Diversification does not guarantee profit or protect against loss.<br/><br/>
+
+    This document is confidential and intended solely for the use of the intended recipient.
+    Distribution to third parties without prior written consent is strictly prohibited.
+    """
+
+
+@lru_cache(maxsize=None)
+def _text_block_styles():
+    """
+    Build the ReportLab paragraph styles for text blocks once per process.
+
+    Returns:
+        Dict with 'title', 'body' and 'disclaimer' ParagraphStyles
+    """
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_JUSTIFY
+
+    styles = getSampleStyleSheet()
+    return {
+        'title': styles['Title'],
+        'body': styles['BodyText'],
+        'disclaimer': ParagraphStyle(
+            'Disclaimer',
+            parent=styles['Normal'],
+            fontSize=9,
+            alignment=TA_JUSTIFY
+        ),
+    }
+
+
 def generate_strategy_description(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
     """Generate strategy description text block as PDF."""
+    import io
+    from pathlib import Path
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet
 
-    program = db.fetch_one("""
-        SELECT p.program_name, p.fund_size, p.starting_date, m.manager_name
-        FROM programs p
-        JOIN managers m ON p.manager_id = m.id
-        WHERE p.id = ?
-    """, (program_id,))
-
-    if not program:
-        raise ValueError(f"Program ID {program_id} not found")
+    program = _get_program_meta(db, program_id)
 
-    doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
+    # Build in memory and write the file in one go (export folders may be network/synced drives)
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = _text_block_styles()
     elements = []
 
     # Title
-    title = Paragraph(f"<b>{program['manager_name']} - {program['program_name']}</b>", styles['Title'])
+    title = Paragraph(_DESC_TITLE_TEMPLATE.format_map(program), styles['title'])
     elements.append(title)
     elements.append(Spacer(1, 12))
 
     # Description
-    description = f"""
-    <b>Program:</b> {program['program_name']}<br/>
-    <b>Fund Size:</b> ${program['fund_size']:,.0f}<br/>
-    <b>Inception Date:</b> {program['starting_date']}<br/><br/>
-
-    This is a systematic trading program that employs quantitative strategies
-    across multiple asset classes. The strategy focuses on risk-adjusted returns
-    through diversified market exposure and disciplined risk management.
-    """
-
-    desc_para = Paragraph(description, styles['BodyText'])
+    desc_para = Paragraph(_DESC_TEMPLATE.format_map(program), styles['body'])
     elements.append(desc_para)
 
     doc.build(elements)
+    Path(output_path).write_bytes(buffer.getvalue())
     return output_path
 
 
-def generate_disclaimer(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
-    """Generate standard disclaimer as PDF."""
+@lru_cache(maxsize=None)
+def _disclaimer_pdf_bytes():
+    """
+    Build the disclaimer PDF once per process and return its bytes.
+
+    The disclaimer has no program-specific content, so every output file is a
+    copy of the same document.
+    """
+    import io
     from reportlab.lib.pagesizes import letter
     from reportlab.platypus import SimpleDocTemplate, Paragraph
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.enums import TA_JUSTIFY
 
-    doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    disclaimer_para = Paragraph(_DISCLAIMER_TEXT, _text_block_styles()['disclaimer'])
 
-    disclaimer_style = ParagraphStyle(
-        'Disclaimer',
-        parent=styles['Normal'],
-        fontSize=9,
-        alignment=TA_JUSTIFY
-    )
+    doc.build([disclaimer_para])
+    return buffer.getvalue()
 
-    disclaimer_text = """
-    <b>IMPORTANT DISCLAIMER</b><br/><br/>
 
-    Past performance is not indicative of future results. This material is for informational
-    purposes only and does not constitute investment advice or a recommendation to buy or sell
-    any security. The information contained herein has been prepared solely for informational
-    purposes and is not an offer to buy or sell or a solicitation of an offer to buy or sell
-    any security or to participate in any trading strategy.<br/><br/>
+def generate_disclaimer(db, program_id, output_path, benchmarks=None, variant=None, **kwargs):
+    """Generate standard disclaimer as PDF."""
+    with open(output_path, 'wb') as f:
+        f.write(_disclaimer_pdf_bytes())
+    return output_path
 
-    Any investment involves substantial risks, including complete loss of capital. There can
-    be no assurance that any investment strategy will be successful. All investments involve
-    risk and may lose value. Diversification does not guarantee profit or protect against loss.<br/><br/>
 
-    This document is confidential and intended solely for the use of the intended recipient.
-    Distribution to third parties without prior written consent is strictly prohibited.
-    """
+# =============================================================================
+# Fee Scenario Components
+# =============================================================================
 
-    disclaimer_para = Paragraph(disclaimer_text, disclaimer_style)
+def generate_yearly_fees_summary(*args, **kwargs):
+    """Generate yearly fees summary table (see components.yearly_fees_summary)."""
+    from components.yearly_fees_summary import generate_yearly_fees_summary as _generate
+    return _generate(*args, **kwargs)
 
-    doc.build([disclaimer_para])
-    return output_path
+
+def generate_detailed_fees_excel(*args, **kwargs):
+    """Generate detailed fees Excel export (see components.detailed_fees_excel)."""
+    from components.detailed_fees_excel import generate_detailed_fees_excel as _generate
+    return _generate(*args, **kwargs)
 
 
 # =============================================================================
 # Component Registration
 # =============================================================================
 
+# Set once register_all_components() has populated the registry
+_components_registered = False
+
+
 def register_all_components():
-    """Register all available components with the global registry."""
+    """
+    Register all available components with the global registry.
+
+    Safe to call more than once (e.g. from worker processes that re-import this
+    module): later calls are no-ops instead of raising on duplicate IDs.
+    """
+    global _components_registered
+    if _components_registered:
+        return
 
     # CHARTS
     # Compounded variant commented out - keeping additive only for now
@@ -878,207 +1031,8 @@ def register_all_components():
         version='1.0.0'
     )
 
-    # Rolling CAGR Charts (Month-based windows)
-    register_component(
-        id='rolling_cagr_1month',
-        name='Rolling CAGR (1-Month)',
-        category='chart',
-        description='1-month rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_1month,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_cagr_2month',
-        name='Rolling CAGR (2-Month)',
-        category='chart',
-        description='2-month rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_2month,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_cagr_3month',
-        name='Rolling CAGR (3-Month)',
-        category='chart',
-        description='3-month rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_3month,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_cagr_6month',
-        name='Rolling CAGR (6-Month)',
-        category='chart',
-        description='6-month rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_6month,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    # Rolling CAGR Charts (Year-based windows)
-    register_component(
-        id='rolling_cagr_1year',
-        name='Rolling CAGR (1-Year)',
-        category='chart',
-        description='1-year rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_1year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_cagr_2year',
-        name='Rolling CAGR (2-Year)',
-        category='chart',
-        description='2-year rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_2year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_cagr_3year',
-        name='Rolling CAGR (3-Year)',
-        category='chart',
-        description='3-year rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_3year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_cagr_5year',
-        name='Rolling CAGR (5-Year)',
-        category='chart',
-        description='5-year rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_5year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_cagr_10year',
-        name='Rolling CAGR (10-Year)',
-        category='chart',
-        description='10-year rolling CAGR with 1-day slide intervals',
-        function=generate_rolling_cagr_10year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    # Rolling Annualized Return Charts (Month-based windows)
-    register_component(
-        id='rolling_annualized_return_1month',
-        name='Rolling Annualized Return (1-Month)',
-        category='chart',
-        description='1-month rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_1month,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_annualized_return_2month',
-        name='Rolling Annualized Return (2-Month)',
-        category='chart',
-        description='2-month rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_2month,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_annualized_return_3month',
-        name='Rolling Annualized Return (3-Month)',
-        category='chart',
-        description='3-month rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_3month,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_annualized_return_6month',
-        name='Rolling Annualized Return (6-Month)',
-        category='chart',
-        description='6-month rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_6month,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    # Rolling Annualized Return Charts (Year-based windows)
-    register_component(
-        id='rolling_annualized_return_1year',
-        name='Rolling Annualized Return (1-Year)',
-        category='chart',
-        description='1-year rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_1year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_annualized_return_2year',
-        name='Rolling Annualized Return (2-Year)',
-        category='chart',
-        description='2-year rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_2year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_annualized_return_3year',
-        name='Rolling Annualized Return (3-Year)',
-        category='chart',
-        description='3-year rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_3year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_annualized_return_5year',
-        name='Rolling Annualized Return (5-Year)',
-        category='chart',
-        description='5-year rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_5year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
-
-    register_component(
-        id='rolling_annualized_return_10year',
-        name='Rolling Annualized Return (10-Year)',
-        category='chart',
-        description='10-year rolling annualized return (arithmetic mean × 261) with 1-day slide',
-        function=generate_rolling_annualized_return_10year,
-        benchmark_support=True,
-        benchmark_combinations=[[], ['sp500'], ['areit']],
-        version='1.0.0'
-    )
+    # Rolling CAGR and Annualized Return Charts (month- and year-based windows)
+    _register_rolling_statistic_components()
 
     # TABLES
     register_component(
@@ -1134,6 +1088,9 @@ def register_all_components():
         version='1.0.0'
     )
 
+    _components_registered = True
+    get_registry().freeze()
+
 
 # Auto-register on import
 register_all_components()
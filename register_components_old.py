@@ -92,18 +92,6 @@ def generate_cumulative_windows_5yr_additive(db, program_id, output_path, benchm
         borrow_mode=True
     )
 
-    # Convert to dict format
-    windows = []
-    for wd in window_defs:
-        window_dict = {
-            'start_date': wd.start_date,
-            'end_date': wd.end_date,
-            'name': f"{wd.start_date.strftime('%Y-%m-%d')} to {wd.end_date.strftime('%Y-%m-%d')}",
-            'borrowed_start_date': wd.borrowed_data_start_date,
-            'borrowed_end_date': wd.borrowed_data_end_date
-        }
-        windows.append(window_dict)
-
     # Generate chart
     from generate_alphabet_mft_cumulative_windows_additive import generate_additive_chart
 
@@ -113,7 +101,7 @@ def generate_cumulative_windows_5yr_additive(db, program_id, output_path, benchm
     fig = generate_additive_chart(
         db=db,
         program_id=program_id,
-        windows=windows,
+        windows=window_defs,
         benchmark_market_id=benchmark_id,
         starting_nav=program['starting_nav'],
         output_path=output_path,
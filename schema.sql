@@ -61,6 +61,22 @@ CREATE TABLE IF NOT EXISTS pnl_records (
     UNIQUE(date, market_id, program_id, resolution)
 );
 
+-- Sector daily summary: pnl_records pre-aggregated per program, sector and date
+-- Rebuilt from pnl_records by query_by_sector.refresh_pnl_sector_daily() after ingest
+CREATE TABLE IF NOT EXISTS pnl_sector_daily (
+    program_id INTEGER NOT NULL,
+    sector_id INTEGER NOT NULL,
+    date DATE NOT NULL,
+    return_sum REAL NOT NULL,       -- Sum of market returns in the sector on this date
+    min_return REAL NOT NULL,
+    max_return REAL NOT NULL,
+    positive_count INTEGER NOT NULL, -- Number of market records with return > 0
+    record_count INTEGER NOT NULL,   -- Number of market records aggregated
+    FOREIGN KEY (program_id) REFERENCES programs(id) ON DELETE CASCADE,
+    FOREIGN KEY (sector_id) REFERENCES sectors(id) ON DELETE CASCADE,
+    UNIQUE(program_id, sector_id, date)
+);
+
 -- Brochure Templates table: reusable templates for brochures
 CREATE TABLE IF NOT EXISTS brochure_templates (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -120,8 +136,13 @@ CREATE INDEX IF NOT EXISTS idx_pnl_market ON pnl_records(market_id);
 CREATE INDEX IF NOT EXISTS idx_pnl_resolution ON pnl_records(resolution);
 CREATE INDEX IF NOT EXISTS idx_pnl_date_program ON pnl_records(date, program_id);
 CREATE INDEX IF NOT EXISTS idx_pnl_program_resolution ON pnl_records(program_id, resolution);
+-- Covering index: per-market series scans (program, market ordered by date) read only the index
+CREATE INDEX IF NOT EXISTS idx_pnl_covering ON pnl_records(program_id, market_id, date, return);
 CREATE INDEX IF NOT EXISTS idx_programs_manager ON programs(manager_id);
 CREATE INDEX IF NOT EXISTS idx_sectors_grouping ON sectors(grouping_name);
 CREATE INDEX IF NOT EXISTS idx_brochure_instances_manager ON brochure_instances(manager_id);
 CREATE INDEX IF NOT EXISTS idx_brochure_components_parent ON brochure_components(parent_id, parent_type);
 CREATE INDEX IF NOT EXISTS idx_generated_brochures_instance ON generated_brochures(brochure_instance_id);
+
+-- Refresh planner statistics so the covering index is chosen for series scans
+ANALYZE pnl_records;
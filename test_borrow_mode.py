@@ -76,9 +76,11 @@ def run_test(db, program_id, min_date, max_date):
         borrow_mode=False
     )
 
-    for i, win in enumerate(windows_no_borrow, 1):
-        years = (win.end_date - win.start_date).days / 365.25
-        print(f"    Window {i}: {win.start_date} to {win.end_date} ({years:.2f} years)")
+    print("\n".join(
+        f"    Window {i}: {win.start_date} to {win.end_date} "
+        f"({(win.end_date - win.start_date).days / 365.25:.2f} years)"
+        for i, win in enumerate(windows_no_borrow, 1)
+    ))
 
     print()
 
@@ -94,13 +96,15 @@ def run_test(db, program_id, min_date, max_date):
         borrow_mode=True
     )
 
+    lines = []
     for i, win in enumerate(windows_with_borrow, 1):
         years = (win.end_date - win.start_date).days / 365.25
         borrowed_msg = ""
         if win.borrowed_data_start_date and win.borrowed_data_end_date:
             borrowed_years = (win.borrowed_data_end_date - win.borrowed_data_start_date).days / 365.25
             borrowed_msg = f" [BORROWED: {win.borrowed_data_start_date} to {win.borrowed_data_end_date} ({borrowed_years:.2f} years)]"
-        print(f"    Window {i}: {win.start_date} to {win.end_date} ({years:.2f} years){borrowed_msg}")
+        lines.append(f"    Window {i}: {win.start_date} to {win.end_date} ({years:.2f} years){borrowed_msg}")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -9,9 +9,29 @@ from windows import (
     compute_statistics,
     generate_window_definitions_non_overlapping_snapped
 )
+from dataclasses import asdict
 from datetime import date
 
 
+# One block per entity, filled from a Statistics dataclass plus 'name'
+_STATS_TEMPLATE = (
+    "  {name}:\n"
+    "    Observations:              {count}\n"
+    "    Mean Monthly Return:       {mean:>8.2%}\n"
+    "    Median Monthly Return:     {median:>8.2%}\n"
+    "    Std Dev:                   {std_dev:>8.2%}\n"
+    "    Cumulative (Compounded):   {cumulative_return_compounded:>8.2%}\n"
+    "    Cumulative (Simple):       {cumulative_return_simple:>8.2%}\n"
+    "    Max DD (Compounded):       {max_drawdown_compounded:>8.2%}\n"
+    "    Max DD (Simple):          ${max_drawdown_simple:>8,.2f}"
+)
+
+
+def format_stats(name, stats):
+    """Format a Statistics object as an indented multi-line block headed by name."""
+    return _STATS_TEMPLATE.format_map(asdict(stats) | {'name': name})
+
+
 def main():
     db = Database('pnlrg.db')
     db.connect()
@@ -57,27 +77,11 @@ def main():
 
             # Program statistics
             prog_stats = compute_statistics(window, program_id, entity_type='manager')
-            print(f"  {program_name}:")
-            print(f"    Observations:              {prog_stats.count}")
-            print(f"    Mean Monthly Return:       {prog_stats.mean:>8.2%}")
-            print(f"    Median Monthly Return:     {prog_stats.median:>8.2%}")
-            print(f"    Std Dev:                   {prog_stats.std_dev:>8.2%}")
-            print(f"    Cumulative (Compounded):   {prog_stats.cumulative_return_compounded:>8.2%}")
-            print(f"    Cumulative (Simple):       {prog_stats.cumulative_return_simple:>8.2%}")
-            print(f"    Max DD (Compounded):       {prog_stats.max_drawdown_compounded:>8.2%}")
-            print(f"    Max DD (Simple):          ${prog_stats.max_drawdown_simple:>8,.2f}")
+            print(format_stats(program_name, prog_stats))
 
             # Benchmark statistics
             bm_stats = compute_statistics(window, sp500['id'], entity_type='benchmark')
-            print(f"\n  {sp500['name']}:")
-            print(f"    Observations:              {bm_stats.count}")
-            print(f"    Mean Monthly Return:       {bm_stats.mean:>8.2%}")
-            print(f"    Median Monthly Return:     {bm_stats.median:>8.2%}")
-            print(f"    Std Dev:                   {bm_stats.std_dev:>8.2%}")
-            print(f"    Cumulative (Compounded):   {bm_stats.cumulative_return_compounded:>8.2%}")
-            print(f"    Cumulative (Simple):       {bm_stats.cumulative_return_simple:>8.2%}")
-            print(f"    Max DD (Compounded):       {bm_stats.max_drawdown_compounded:>8.2%}")
-            print(f"    Max DD (Simple):          ${bm_stats.max_drawdown_simple:>8,.2f}")
+            print("\n" + format_stats(sp500['name'], bm_stats))
 
             # Calculate outperformance
             outperf = prog_stats.cumulative_return_compounded - bm_stats.cumulative_return_compounded
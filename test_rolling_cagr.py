@@ -4,9 +4,55 @@ Test script for rolling CAGR chart generation.
 This script tests the new rolling CAGR chart component with the Alphabet MFT program.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from database import Database
 from components.rolling_cagr_chart import generate_rolling_cagr_chart
 from pathlib import Path
+from register_components import configure_kaleido_scope
+import os
+
+
+# (test name, window months, benchmarks, output filename)
+TESTS = [
+    ("1-year rolling CAGR (no benchmark)", 12, None, "rolling_cagr_1year.pdf"),
+    ("1-year rolling CAGR with SP500 benchmark", 12, ['sp500'], "rolling_cagr_1year_sp500.pdf"),
+    ("6-month rolling CAGR (no benchmark)", 6, None, "rolling_cagr_6month.pdf"),
+    ("3-year rolling CAGR with AREIT benchmark", 36, ['areit'], "rolling_cagr_3year_areit.pdf"),
+]
+
+
+def _init_worker():
+    """
+    Set up this worker's Kaleido scope before its first chart.
+
+    The scope (and its Chromium renderer, once started) lives for the whole
+    worker process, so every chart the worker renders after the first reuses it.
+    """
+    configure_kaleido_scope()
+
+
+def run_test(output_dir, program_id, window_months, benchmarks, filename):
+    """
+    Render one rolling CAGR chart in its own process.
+
+    Each worker opens its own Database connection (SQLite connections must
+    not be shared across processes).
+
+    Returns:
+        Tuple of (ok, error message or None)
+    """
+    try:
+        with Database() as db:
+            generate_rolling_cagr_chart(
+                db=db,
+                program_id=program_id,
+                output_path=str(Path(output_dir) / filename),
+                window_months=window_months,
+                benchmarks=benchmarks
+            )
+        return True, None
+    except Exception as e:
+        return False, str(e)
 
 
 def test_rolling_cagr():
@@ -25,84 +71,36 @@ def test_rolling_cagr():
             WHERE m.manager_name = 'Alphabet' AND p.program_name = 'MFT'
         """)
 
-        if not program:
-            print("ERROR: Alphabet MFT program not found in database")
-            return
+    if not program:
+        print("ERROR: Alphabet MFT program not found in database")
+        return
 
-        print(f"Found program: {program['manager_name']} {program['program_name']} (ID: {program['id']})")
-        print()
+    print(f"Found program: {program['manager_name']} {program['program_name']} (ID: {program['id']})")
+    print()
 
-        # Test 1: 1-year rolling CAGR (no benchmark)
-        print("Test 1: 1-year rolling CAGR (no benchmark)")
-        print("-" * 60)
-        try:
-            fig1 = generate_rolling_cagr_chart(
-                db=db,
-                program_id=program['id'],
-                output_path=str(output_dir / "rolling_cagr_1year.pdf"),
-                window_months=12,
-                benchmarks=None
-            )
-            print("[PASS] Test 1: 1-year rolling CAGR generated successfully")
-            print()
-        except Exception as e:
-            print(f"[FAIL] Test 1: {e}")
-            print()
-
-        # Test 2: 1-year rolling CAGR with SP500 benchmark
-        print("Test 2: 1-year rolling CAGR with SP500 benchmark")
-        print("-" * 60)
-        try:
-            fig2 = generate_rolling_cagr_chart(
-                db=db,
-                program_id=program['id'],
-                output_path=str(output_dir / "rolling_cagr_1year_sp500.pdf"),
-                window_months=12,
-                benchmarks=['sp500']
-            )
-            print("[PASS] Test 2: 1-year rolling CAGR with SP500 generated successfully")
-            print()
-        except Exception as e:
-            print(f"[FAIL] Test 2: {e}")
-            print()
-
-        # Test 3: 6-month rolling CAGR
-        print("Test 3: 6-month rolling CAGR (no benchmark)")
-        print("-" * 60)
-        try:
-            fig3 = generate_rolling_cagr_chart(
-                db=db,
-                program_id=program['id'],
-                output_path=str(output_dir / "rolling_cagr_6month.pdf"),
-                window_months=6,
-                benchmarks=None
-            )
-            print("[PASS] Test 3: 6-month rolling CAGR generated successfully")
-            print()
-        except Exception as e:
-            print(f"[FAIL] Test 3: {e}")
-            print()
-
-        # Test 4: 3-year rolling CAGR with AREIT benchmark
-        print("Test 4: 3-year rolling CAGR with AREIT benchmark")
+    # Kaleido start-up dominates each render, so run the charts side by side. Each
+    # worker starts one renderer; with fewer cores than tests a worker renders
+    # several charts on its warm scope instead of paying Chromium start-up again.
+    max_workers = min(len(TESTS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(run_test, str(output_dir), program['id'], window_months, benchmarks, filename)
+            for _, window_months, benchmarks, filename in TESTS
+        ]
+        results = [future.result() for future in futures]
+
+    for i, ((name, *_), (ok, error)) in enumerate(zip(TESTS, results), start=1):
+        print(f"Test {i}: {name}")
         print("-" * 60)
-        try:
-            fig4 = generate_rolling_cagr_chart(
-                db=db,
-                program_id=program['id'],
-                output_path=str(output_dir / "rolling_cagr_3year_areit.pdf"),
-                window_months=36,
-                benchmarks=['areit']
-            )
-            print("[PASS] Test 4: 3-year rolling CAGR with AREIT generated successfully")
-            print()
-        except Exception as e:
-            print(f"[FAIL] Test 4: {e}")
-            print()
-
-        print("=" * 60)
-        print(f"All tests completed. Check the '{output_dir}' directory for output files.")
-        print("=" * 60)
+        if ok:
+            print(f"[PASS] Test {i}: {name} generated successfully")
+        else:
+            print(f"[FAIL] Test {i}: {error}")
+        print()
+
+    print("=" * 60)
+    print(f"All tests completed. Check the '{output_dir}' directory for output files.")
+    print("=" * 60)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ to the original chart generation.
 
 from database import Database
 from components.charts import equity_curve_chart, equity_curve_chart_from_window
+import numpy as np
 import plotly.graph_objects as go
 
 
@@ -27,25 +28,28 @@ def compare_figures(fig1, fig2, name1="Figure 1", name2="Figure 2"):
         trace_name = trace1.name
         print(f"\n  Trace {i}: {trace_name}")
 
+        x1, x2 = np.asarray(trace1.x), np.asarray(trace2.x)
+        y1, y2 = np.asarray(trace1.y, dtype=float), np.asarray(trace2.y, dtype=float)
+
         # Compare data points
-        if len(trace1.x) != len(trace2.x):
-            print(f"    [DIFF] Data points: {len(trace1.x)} vs {len(trace2.x)}")
+        if len(x1) != len(x2):
+            print(f"    [DIFF] Data points: {len(x1)} vs {len(x2)}")
+            all_match = False
+        elif not np.array_equal(x1, x2):
+            print("    [DIFF] Dates differ")
             all_match = False
         else:
-            print(f"    [OK] Data points: {len(trace1.x)}")
-
-        # Compare first and last y values (NAV)
-        if len(trace1.y) > 0 and len(trace2.y) > 0:
-            y1_first, y1_last = trace1.y[0], trace1.y[-1]
-            y2_first, y2_last = trace2.y[0], trace2.y[-1]
+            print(f"    [OK] Data points: {len(x1)}")
 
+        # Compare the whole NAV series (y values)
+        if len(y1) > 0 and len(y2) > 0:
             # Allow small floating point differences
-            if abs(y1_first - y2_first) < 0.01 and abs(y1_last - y2_last) < 0.01:
-                print(f"    [OK] NAV values: Start={y1_first:.2f}, End={y1_last:.2f}")
+            if len(y1) == len(y2) and np.allclose(y1, y2, atol=0.01, rtol=0):
+                print(f"    [OK] NAV values: Start={y1[0]:.2f}, End={y1[-1]:.2f}")
             else:
                 print(f"    [DIFF] NAV values:")
-                print(f"      {name1}: Start={y1_first:.2f}, End={y1_last:.2f}")
-                print(f"      {name2}: Start={y2_first:.2f}, End={y2_last:.2f}")
+                print(f"      {name1}: Start={y1[0]:.2f}, End={y1[-1]:.2f}")
+                print(f"      {name2}: Start={y2[0]:.2f}, End={y2[-1]:.2f}")
                 all_match = False
 
         # Compare trace name
@@ -1,7 +1,8 @@
 """Verify all benchmark data is imported correctly."""
 
 from database import Database
-import pandas as pd
+from datetime import date
+import numpy as np
 
 db = Database('pnlrg.db')
 db.connect()
@@ -41,41 +42,53 @@ print("="*80)
 
 starting_nav = 1000.0
 
+# One scan of every benchmark series, sorted by market then date. Each market is a
+# contiguous slice; cumlog is the log-growth prefix sum (cumlog[k] = sum(log1p(rets[:k]))),
+# so the growth of any slice [i0:i1] is exp(cumlog[i1] - cumlog[i0]).
+bm_rows = db.fetch_all_tuples("""
+    SELECT m.name, pr.date, pr.return
+    FROM pnl_records pr
+    JOIN markets m ON pr.market_id = m.id
+    WHERE m.is_benchmark = 1
+    AND pr.program_id = ?
+    ORDER BY m.name, pr.date
+""", (benchmarks_program_id,))
+
+bm_names, bm_dates, bm_rets = zip(*bm_rows) if bm_rows else ((), (), ())
+bm_names = np.array(bm_names, dtype=object)
+bm_dates = np.array(bm_dates, dtype=object)
+bm_cumlog = np.concatenate(([0.0], np.cumsum(np.log1p(np.array(bm_rets, dtype=float)))))
+
+# Per-market [i0, i1) bounds into the arrays above
+bm_slices = {
+    bm['name']: (int(np.searchsorted(bm_names, bm['name'], side='left')),
+                 int(np.searchsorted(bm_names, bm['name'], side='right')))
+    for bm in benchmarks
+}
+
 for bm in benchmarks:
     market_name = bm['name']
+    i0, i1 = bm_slices[market_name]
 
-    # Get all returns for this benchmark
-    returns = db.fetch_all("""
-        SELECT pr.date, pr.return
-        FROM pnl_records pr
-        JOIN markets m ON pr.market_id = m.id
-        WHERE m.name = ?
-        AND pr.program_id = ?
-        ORDER BY pr.date
-    """, (market_name, benchmarks_program_id))
-
-    if not returns:
+    if i1 == i0:
         print(f"\n{market_name}:")
         print("  No data found!")
         continue
 
-    df = pd.DataFrame(returns, columns=['date', 'return'])
-    df['nav'] = starting_nav * (1 + df['return']).cumprod()
-
-    start_date = df['date'].iloc[0]
-    end_date = df['date'].iloc[-1]
-    final_nav = df['nav'].iloc[-1]
+    start_date = bm_dates[i0]
+    end_date = bm_dates[i1 - 1]
+    final_nav = starting_nav * np.exp(bm_cumlog[i1] - bm_cumlog[i0])
     total_return = (final_nav / starting_nav - 1) * 100
 
     # Calculate years for CAGR
-    start_year = pd.to_datetime(start_date).year
-    end_year = pd.to_datetime(end_date).year
-    years = end_year - start_year + (pd.to_datetime(end_date).month - pd.to_datetime(start_date).month) / 12
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    years = end.year - start.year + (end.month - start.month) / 12
 
     cagr = ((final_nav / starting_nav) ** (1/years) - 1) * 100 if years > 0 else 0
 
     print(f"\n{market_name}:")
-    print(f"  Records:       {len(returns)}")
+    print(f"  Records:       {i1 - i0}")
     print(f"  Date Range:    {start_date} to {end_date}")
     print(f"  Starting NAV:  ${starting_nav:,.2f}")
     print(f"  Ending NAV:    ${final_nav:,.2f}")
@@ -86,8 +99,7 @@ for bm in benchmarks:
 print("\n\n3. Rise CTA vs All Benchmarks (Aligned Start Dates):")
 print("="*80)
 
-# Get Rise data
-rise_returns = db.fetch_all("""
+rise_rows = db.fetch_all_tuples("""
     SELECT pr.date, pr.return
     FROM pnl_records pr
     JOIN markets m ON pr.market_id = m.id
@@ -97,49 +109,29 @@ rise_returns = db.fetch_all("""
     ORDER BY pr.date
 """)
 
-rise_df = pd.DataFrame(rise_returns, columns=['date', 'return'])
-rise_df['date'] = pd.to_datetime(rise_df['date'])
-rise_df['nav'] = starting_nav * (1 + rise_df['return']).cumprod()
+rise_dates, rise_rets = zip(*rise_rows) if rise_rows else ((), ())
+rise_dates = np.array(rise_dates, dtype=object)
+rise_cumlog = np.concatenate(([0.0], np.cumsum(np.log1p(np.array(rise_rets, dtype=float)))))
 
+# Align Rise to each benchmark's window, reusing the benchmark slices from section 2
 for bm in benchmarks:
     market_name = bm['name']
-
-    # Get benchmark returns
-    bm_returns = db.fetch_all("""
-        SELECT pr.date, pr.return
-        FROM pnl_records pr
-        JOIN markets m ON pr.market_id = m.id
-        WHERE m.name = ?
-        AND pr.program_id = ?
-        ORDER BY pr.date
-    """, (market_name, benchmarks_program_id))
-
-    if not bm_returns:
+    i0, i1 = bm_slices[market_name]
+    if i1 == i0:
         continue
 
-    bm_df = pd.DataFrame(bm_returns, columns=['date', 'return'])
-    bm_df['date'] = pd.to_datetime(bm_df['date'])
-
-    # Find common date range
-    bm_start = bm_df['date'].min()
-    bm_end = bm_df['date'].max()
-
-    # Filter Rise to same date range
-    rise_aligned = rise_df[(rise_df['date'] >= bm_start) & (rise_df['date'] <= bm_end)].copy()
-
-    if len(rise_aligned) == 0:
+    start_date = bm_dates[i0]
+    end_date = bm_dates[i1 - 1]
+    r0 = int(np.searchsorted(rise_dates, start_date, side='left'))
+    r1 = int(np.searchsorted(rise_dates, end_date, side='right'))
+    if r1 == r0:
         continue
 
-    # Calculate NAV from aligned start
-    rise_aligned['nav'] = starting_nav * (1 + rise_aligned['return']).cumprod()
-    bm_df['nav'] = starting_nav * (1 + bm_df['return']).cumprod()
-
-    rise_final = rise_aligned['nav'].iloc[-1]
-    bm_final = bm_df['nav'].iloc[-1]
-
+    rise_final = starting_nav * np.exp(rise_cumlog[r1] - rise_cumlog[r0])
+    bm_final = starting_nav * np.exp(bm_cumlog[i1] - bm_cumlog[i0])
     outperformance = ((rise_final / bm_final) - 1) * 100
 
-    print(f"\n{market_name} ({bm_start.strftime('%Y-%m-%d')} to {bm_end.strftime('%Y-%m-%d')}):")
+    print(f"\n{market_name} ({start_date} to {end_date}):")
     print(f"  Rise Final NAV:       ${rise_final:,.2f}")
     print(f"  {market_name} Final NAV:  ${bm_final:,.2f}")
     print(f"  Outperformance:       {outperformance:+.2f}%")
@@ -9,6 +9,8 @@ This script performs detailed verification of the imported data:
 """
 
 import csv
+from datetime import datetime
+from itertools import islice
 from database import Database
 
 
@@ -59,15 +61,16 @@ def verify_alphabet_import():
 
         # 3. Verify markets
         print("\n3. Market Verification")
+        markets = db.fetch_all(
+            f"SELECT id, name FROM markets WHERE name IN ({','.join('?' * len(SECTORS))})",
+            tuple(SECTORS)
+        )
+        found_ids = {m['name']: m['id'] for m in markets}
         market_ids = {}
         for sector in SECTORS:
-            market = db.fetch_one(
-                "SELECT id, name, asset_class, region, currency FROM markets WHERE name = ?",
-                (sector,)
-            )
-            if market:
-                market_ids[sector] = market['id']
-                print(f"   [OK] Market '{sector}' found (ID: {market['id']})")
+            if sector in found_ids:
+                market_ids[sector] = found_ids[sector]
+                print(f"   [OK] Market '{sector}' found (ID: {found_ids[sector]})")
             else:
                 print(f"   [ERROR] Market '{sector}' not found!")
                 return
@@ -80,13 +83,17 @@ def verify_alphabet_import():
         )['cnt']
         print(f"   Total records in database: {total_records:,}")
 
-        # Per-market counts
+        # Per-market counts in one grouped scan
+        market_counts = {
+            row['market_id']: row['cnt']
+            for row in db.fetch_all(
+                """SELECT market_id, COUNT(*) as cnt FROM pnl_records
+                   WHERE program_id = ? GROUP BY market_id""",
+                (program['id'],)
+            )
+        }
         for sector in SECTORS:
-            count = db.fetch_one(
-                """SELECT COUNT(*) as cnt FROM pnl_records
-                   WHERE market_id = ? AND program_id = ?""",
-                (market_ids[sector], program['id'])
-            )['cnt']
+            count = market_counts.get(market_ids[sector], 0)
             print(f"   {sector:20s}: {count:5,} records")
 
         # 5. Date range verification
@@ -107,13 +114,17 @@ def verify_alphabet_import():
         print("\n6. CSV Cross-Check")
         with open(CSV_PATH, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
-            csv_rows = list(reader)
-
-        print(f"   CSV rows: {len(csv_rows):,}")
-        print(f"   Expected total records: {len(csv_rows) * len(SECTORS):,}")
+            # Only the first rows are compared; the rest are counted on the
+            # underlying csv.reader (no dict per row), skipping blank lines as
+            # DictReader does
+            sample_rows = list(islice(reader, 3))
+            csv_row_count = len(sample_rows) + sum(1 for row in reader.reader if row)
+
+        print(f"   CSV rows: {csv_row_count:,}")
+        print(f"   Expected total records: {csv_row_count * len(SECTORS):,}")
         print(f"   Actual total records: {total_records:,}")
 
-        if total_records == len(csv_rows) * len(SECTORS):
+        if total_records == csv_row_count * len(SECTORS):
             print(f"   [OK] Record counts match!")
         else:
             print(f"   [WARNING] Record count mismatch!")
@@ -121,16 +132,27 @@ def verify_alphabet_import():
         # 7. Sample data verification (first 3 rows)
         print("\n7. Sample Data Verification (First 3 Rows)")
 
-        for i in range(min(3, len(csv_rows))):
-            csv_row = csv_rows[i]
-            date_str = csv_row['Date']
-
-            # Parse date (DD/MM/YYYY)
-            from datetime import datetime
-            date_obj = datetime.strptime(date_str, '%d/%m/%Y').date()
-            db_date = date_obj.strftime('%Y-%m-%d')
+        # Parse dates (DD/MM/YYYY)
+        db_dates = [
+            datetime.strptime(row['Date'], '%d/%m/%Y').date().strftime('%Y-%m-%d')
+            for row in sample_rows
+        ]
+
+        # Fetch every sampled (date, market) return in one round trip
+        market_id_list = list(market_ids.values())
+        db_returns = {}
+        if db_dates:
+            sample_records = db.fetch_all(
+                f"""SELECT date, market_id, return FROM pnl_records
+                    WHERE program_id = ?
+                      AND date IN ({','.join('?' * len(db_dates))})
+                      AND market_id IN ({','.join('?' * len(market_id_list))})""",
+                (program['id'], *db_dates, *market_id_list)
+            )
+            db_returns = {(r['date'], r['market_id']): r['return'] for r in sample_records}
 
-            print(f"\n   Row {i+1}: {date_str} -> {db_date}")
+        for i, (csv_row, db_date) in enumerate(zip(sample_rows, db_dates)):
+            print(f"\n   Row {i+1}: {csv_row['Date']} -> {db_date}")
 
             for sector in SECTORS:
                 # Get CSV PnL
@@ -139,14 +161,9 @@ def verify_alphabet_import():
                 expected_return = csv_pnl / FUND_SIZE
 
                 # Get DB return
-                db_return = db.fetch_one(
-                    """SELECT return FROM pnl_records
-                       WHERE date = ? AND market_id = ? AND program_id = ?""",
-                    (db_date, market_ids[sector], program['id'])
-                )
-
-                if db_return:
-                    actual_return = db_return['return']
+                actual_return = db_returns.get((db_date, market_ids[sector]))
+
+                if actual_return is not None:
                     match = abs(actual_return - expected_return) < 1e-10
                     status = "[OK]" if match else "[MISMATCH]"
                     print(f"      {sector:20s}: CSV PnL={csv_pnl:>10,.0f} -> Expected={expected_return:.8f}, Actual={actual_return:.8f} {status}")
@@ -12,6 +12,7 @@ Checks:
 
 import csv
 from datetime import datetime, date
+from functools import lru_cache
 from database import Database
 
 # Configuration
@@ -25,26 +26,47 @@ MARKET_NAMES = [
     "ASX 200", "DAX", "CAC 40", "Kospi 200", "TX index", "WIG 20"
 ]
 
+# Every market the import should have created, with the IN (...) placeholders for it
+ALL_MARKETS = tuple(MARKET_NAMES) + ("AREIT", "SP500")
+_ALL_MARKETS_PLACEHOLDERS = ','.join('?' * len(ALL_MARKETS))
 
+
+@lru_cache(maxsize=None)
 def parse_date(date_str):
-    """Parse DD/MM/YYYY format to YYYY-MM-DD."""
+    """
+    Parse DD/MM/YYYY format to YYYY-MM-DD.
+
+    Four-digit years are split by hand (strptime is slow per row); DD/MM/YY and
+    anything else falls back to strptime. Cached because the market and
+    benchmark CSVs repeat the same dates.
+    """
+    try:
+        day, month, year = date_str.strip().split('/')
+        if len(year) == 4:
+            return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        pass
     try:
         dt = datetime.strptime(date_str.strip(), '%d/%m/%Y')
-        return dt.strftime('%Y-%m-%d')
     except ValueError:
         dt = datetime.strptime(date_str.strip(), '%d/%m/%y')
-        return dt.strftime('%Y-%m-%d')
+    return dt.strftime('%Y-%m-%d')
 
 
 def verify_markets(db):
     """Verify market creation."""
     print("\n=== Market Verification ===")
 
-    all_markets = MARKET_NAMES + ["AREIT", "SP500"]
     found = 0
 
-    for market_name in all_markets:
-        market = db.fetch_one("SELECT id, is_benchmark FROM markets WHERE name = ?", (market_name,))
+    rows = db.fetch_all(
+        f"SELECT id, name, is_benchmark FROM markets WHERE name IN ({_ALL_MARKETS_PLACEHOLDERS})",
+        ALL_MARKETS
+    )
+    by_name = {row['name']: row for row in rows}
+
+    for market_name in ALL_MARKETS:
+        market = by_name.get(market_name)
         if market:
             benchmark_str = "Benchmark" if market['is_benchmark'] else "Trading"
             print(f"[OK] {market_name:15s} (ID: {market['id']:2d}, {benchmark_str})")
@@ -52,53 +74,64 @@ def verify_markets(db):
         else:
             print(f"[ERROR] Market not found: {market_name}")
 
-    print(f"\n[INFO] Found {found}/{len(all_markets)} markets")
-    return found == len(all_markets)
+    print(f"\n[INFO] Found {found}/{len(ALL_MARKETS)} markets")
+    return found == len(ALL_MARKETS)
+
+
+def fetch_program_summary(db, program_id):
+    """
+    Program-wide counts, date range and return statistics in one scan.
+
+    Shared by verify_record_counts(), verify_date_range() and verify_statistics().
+    """
+    return db.fetch_one(
+        """SELECT
+           COUNT(*) as total_records,
+           MIN(date) as min_date,
+           MAX(date) as max_date,
+           COUNT(DISTINCT date) as unique_dates,
+           AVG(return) as avg_return,
+           MIN(return) as min_return,
+           MAX(return) as max_return,
+           SUM(return > 0) as positive_days,
+           SUM(return < 0) as negative_days
+           FROM pnl_records
+           WHERE program_id = ?""",
+        (program_id,)
+    )
 
 
-def verify_record_counts(db, program_id):
+def verify_record_counts(db, program_id, summary):
     """Verify pnl_record counts."""
     print("\n=== Record Count Verification ===")
 
     # Total records
-    total = db.fetch_one(
-        "SELECT COUNT(*) as count FROM pnl_records WHERE program_id = ?",
-        (program_id,)
-    )
-    print(f"Total PnL Records: {total['count']:,}")
+    print(f"Total PnL Records: {summary['total_records']:,}")
 
-    # By market
+    # By market: group on the indexed market_id, then resolve names
     market_counts = db.fetch_all(
-        """SELECT m.name, COUNT(*) as count
-           FROM pnl_records pr
-           JOIN markets m ON pr.market_id = m.id
-           WHERE pr.program_id = ?
-           GROUP BY m.name
-           ORDER BY m.name""",
+        """SELECT market_id, COUNT(*) as count
+           FROM pnl_records
+           WHERE program_id = ?
+           GROUP BY market_id""",
         (program_id,)
     )
+    names = {row['id']: row['name'] for row in db.fetch_all("SELECT id, name FROM markets")}
+    by_name = sorted((names[row['market_id']], row['count']) for row in market_counts)
 
     print(f"\nRecords by Market:")
-    for row in market_counts:
-        print(f"  {row['name']:15s}: {row['count']:,}")
+    print("\n".join(f"  {name:15s}: {count:,}" for name, count in by_name))
 
-    return total['count']
+    return summary['total_records']
 
 
-def verify_date_range(db, program_id):
+def verify_date_range(db, program_id, summary):
     """Verify date ranges."""
     print("\n=== Date Range Verification ===")
 
     # Overall date range
-    date_range = db.fetch_one(
-        """SELECT MIN(date) as min_date, MAX(date) as max_date, COUNT(DISTINCT date) as unique_dates
-           FROM pnl_records
-           WHERE program_id = ?""",
-        (program_id,)
-    )
-
-    print(f"Date Range: {date_range['min_date']} to {date_range['max_date']}")
-    print(f"Unique Trading Days: {date_range['unique_dates']:,}")
+    print(f"Date Range: {summary['min_date']} to {summary['max_date']}")
+    print(f"Unique Trading Days: {summary['unique_dates']:,}")
 
     # Benchmark-specific ranges
     benchmarks = ["AREIT", "SP500"]
@@ -118,19 +151,16 @@ def verify_sample_data(db, program_id):
     """Cross-check sample data against CSV."""
     print("\n=== Sample Data Cross-Check ===")
 
-    # Read first 3 rows from CSV
-    with open(MFT_CSV, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        sample_rows = []
-        for i, row in enumerate(reader):
-            if i < 3:
-                sample_rows.append(row)
-            else:
-                break
+    # Only the header and first data row are needed
+    with open(MFT_CSV, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        first_row = next(reader)
 
     # Check first date, WTI market
-    first_date = parse_date(sample_rows[0]['Date'])
-    wti_pnl = float(sample_rows[0]['WTI'].replace(',', '')) if sample_rows[0]['WTI'] else 0
+    first_date = parse_date(first_row[header.index('Date')])
+    wti_str = first_row[header.index('WTI')]
+    wti_pnl = float(wti_str.replace(',', '')) if wti_str else 0
     expected_return = wti_pnl / FUND_SIZE
 
     db_record = db.fetch_one(
@@ -155,23 +185,10 @@ def verify_sample_data(db, program_id):
         print(f"[ERROR] Sample record not found in DB")
 
 
-def verify_statistics(db, program_id):
+def verify_statistics(stats):
     """Calculate basic statistics."""
     print("\n=== Return Statistics ===")
 
-    stats = db.fetch_one(
-        """SELECT
-           COUNT(*) as total_records,
-           AVG(return) as avg_return,
-           MIN(return) as min_return,
-           MAX(return) as max_return,
-           SUM(CASE WHEN return > 0 THEN 1 ELSE 0 END) as positive_days,
-           SUM(CASE WHEN return < 0 THEN 1 ELSE 0 END) as negative_days
-           FROM pnl_records
-           WHERE program_id = ?""",
-        (program_id,)
-    )
-
     print(f"Total Records: {stats['total_records']:,}")
     print(f"Avg Daily Return: {stats['avg_return']*100:.4f}%")
     print(f"Min Daily Return: {stats['min_return']*100:.2f}%")
@@ -194,8 +211,7 @@ def verify_submission_dates(db, program_id):
     )
 
     print(f"Submissions:")
-    for row in submission_counts:
-        print(f"  {row['submission_date']}: {row['count']:,} records")
+    print("\n".join(f"  {row['submission_date']}: {row['count']:,} records" for row in submission_counts))
 
 
 def main():
@@ -213,11 +229,12 @@ def main():
         print(f"Verifying data for MFT program (ID: {program_id})")
 
         # Run all verifications
+        summary = fetch_program_summary(db, program_id)
         verify_markets(db)
-        verify_record_counts(db, program_id)
-        verify_date_range(db, program_id)
+        verify_record_counts(db, program_id, summary)
+        verify_date_range(db, program_id, summary)
         verify_sample_data(db, program_id)
-        verify_statistics(db, program_id)
+        verify_statistics(summary)
         verify_submission_dates(db, program_id)
 
         print("\n" + "="*50)
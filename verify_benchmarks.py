@@ -1,7 +1,7 @@
 """Verify benchmark data is imported correctly."""
 
 from database import Database
-import pandas as pd
+import math
 
 db = Database('pnlrg.db')
 db.connect()
@@ -39,18 +39,28 @@ if benchmarks_prog:
 else:
     print("  Benchmarks program not found!")
 
+# SP500 and Rise summaries in one grouped query; EXP(log_growth) is the final NAV factor
+summary = {
+    row['name']: row
+    for row in db.fetch_all("""
+        SELECT m.name,
+               COUNT(*) as record_count,
+               MAX(pr.date) as end_date,
+               SUM(log1p(pr.return)) as log_growth
+        FROM pnl_records pr
+        JOIN markets m ON pr.market_id = m.id
+        JOIN programs p ON pr.program_id = p.id
+        WHERE (m.name = 'SP500' AND p.program_name = 'Benchmarks')
+        OR (m.name = 'Rise' AND p.program_name = 'CTA_50M_30')
+        GROUP BY m.name
+    """)
+}
+sp500 = summary['SP500']
+
 # 3. Check SP500 data
 print("\n\n3. SP500 Benchmark Returns:")
 print("-"*70)
-sp500_count = db.fetch_one("""
-    SELECT COUNT(*) as count
-    FROM pnl_records pr
-    JOIN markets m ON pr.market_id = m.id
-    JOIN programs p ON pr.program_id = p.id
-    WHERE m.name = 'SP500'
-    AND p.program_name = 'Benchmarks'
-""")
-print(f"  Total SP500 records: {sp500_count['count']}")
+print(f"  Total SP500 records: {sp500['record_count']}")
 
 # First 10 returns
 sp500_sample = db.fetch_all("""
@@ -71,55 +81,22 @@ for row in sp500_sample:
 # 4. Calculate SP500 performance
 print("\n\n4. SP500 Performance (1973-2017):")
 print("-"*70)
-all_sp500 = db.fetch_all("""
-    SELECT pr.date, pr.return
-    FROM pnl_records pr
-    JOIN markets m ON pr.market_id = m.id
-    JOIN programs p ON pr.program_id = p.id
-    WHERE m.name = 'SP500'
-    AND p.program_name = 'Benchmarks'
-    ORDER BY pr.date
-""")
-
-df = pd.DataFrame(all_sp500, columns=['date', 'return'])
 starting_nav = 1000.0
-df['nav'] = starting_nav * (1 + df['return']).cumprod()
+sp500_nav = starting_nav * math.exp(sp500['log_growth'])
 
 print(f"  Starting NAV:  ${starting_nav:,.2f} (1973-01-03)")
-print(f"  Ending NAV:    ${df['nav'].iloc[-1]:,.2f} ({df['date'].iloc[-1]})")
-print(f"  Total Return:  {(df['nav'].iloc[-1] / starting_nav - 1) * 100:.2f}%")
-print(f"  CAGR:          {((df['nav'].iloc[-1] / starting_nav) ** (1/45) - 1) * 100:.2f}%")
+print(f"  Ending NAV:    ${sp500_nav:,.2f} ({sp500['end_date']})")
+print(f"  Total Return:  {(sp500_nav / starting_nav - 1) * 100:.2f}%")
+print(f"  CAGR:          {((sp500_nav / starting_nav) ** (1/45) - 1) * 100:.2f}%")
 
 # 5. Compare Rise vs SP500
 print("\n\n5. Rise CTA vs SP500 Comparison:")
 print("-"*70)
-rise_final = db.fetch_one("""
-    SELECT pr.return
-    FROM pnl_records pr
-    JOIN markets m ON pr.market_id = m.id
-    JOIN programs p ON pr.program_id = p.id
-    WHERE m.name = 'Rise'
-    AND p.program_name = 'CTA_50M_30'
-    ORDER BY pr.date DESC
-    LIMIT 1
-""")
-
-# Calculate final NAV for Rise
-all_rise = db.fetch_all("""
-    SELECT pr.return
-    FROM pnl_records pr
-    JOIN markets m ON pr.market_id = m.id
-    JOIN programs p ON pr.program_id = p.id
-    WHERE m.name = 'Rise'
-    AND p.program_name = 'CTA_50M_30'
-    ORDER BY pr.date
-""")
-rise_df = pd.DataFrame(all_rise, columns=['return'])
-rise_nav = starting_nav * (1 + rise_df['return']).cumprod().iloc[-1]
+rise_nav = starting_nav * math.exp(summary['Rise']['log_growth'])
 
 print(f"  Rise CTA Final NAV:  ${rise_nav:,.2f}")
-print(f"  SP500 Final NAV:     ${df['nav'].iloc[-1]:,.2f}")
-print(f"  Outperformance:      {((rise_nav / df['nav'].iloc[-1]) - 1) * 100:+.2f}%")
+print(f"  SP500 Final NAV:     ${sp500_nav:,.2f}")
+print(f"  Outperformance:      {((rise_nav / sp500_nav) - 1) * 100:+.2f}%")
 
 print("\n" + "="*70)
 print("VERIFICATION COMPLETE")
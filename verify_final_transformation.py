@@ -1,7 +1,7 @@
 """Verify the transformation to percentage returns is complete and correct."""
 
 from database import Database
-import pandas as pd
+import math
 
 db = Database('pnlrg.db')
 db.connect()
@@ -62,25 +62,25 @@ program = db.fetch_one("""
     WHERE program_name = 'CTA_50M_30'
 """)
 
-all_returns = db.fetch_all("""
-    SELECT pr.date, pr.return
+# Growth factor compounded in SQL; the first return is the first row of the sample above
+nav_summary = db.fetch_one("""
+    SELECT MAX(pr.date) as end_date, SUM(log1p(pr.return)) as log_growth
     FROM pnl_records pr
     JOIN programs p ON pr.program_id = p.id
     JOIN markets m ON pr.market_id = m.id
     WHERE p.program_name = 'CTA_50M_30'
     AND m.name = 'Rise'
     AND pr.resolution = 'monthly'
-    ORDER BY pr.date
 """)
 
-df = pd.DataFrame(all_returns, columns=['date', 'return'])
-df['nav'] = program['starting_nav'] * (1 + df['return']).cumprod()
+first_nav = program['starting_nav'] * (1 + returns[0]['return'])
+final_nav = program['starting_nav'] * math.exp(nav_summary['log_growth'])
 
 print(f"Starting NAV: ${program['starting_nav']:,.2f} on {program['starting_date']}")
-print(f"First NAV:    ${df['nav'].iloc[0]:,.2f} on {df['date'].iloc[0]}")
-print(f"Final NAV:    ${df['nav'].iloc[-1]:,.2f} on {df['date'].iloc[-1]}")
-print(f"Total Return: {(df['nav'].iloc[-1] / program['starting_nav'] - 1) * 100:.2f}%")
-print(f"CAGR:         {((df['nav'].iloc[-1] / program['starting_nav']) ** (1/45) - 1) * 100:.2f}%")
+print(f"First NAV:    ${first_nav:,.2f} on {returns[0]['date']}")
+print(f"Final NAV:    ${final_nav:,.2f} on {nav_summary['end_date']}")
+print(f"Total Return: {(final_nav / program['starting_nav'] - 1) * 100:.2f}%")
+print(f"CAGR:         {((final_nav / program['starting_nav']) ** (1/45) - 1) * 100:.2f}%")
 
 # 5. Record counts
 print("\n\n5. Record Counts:")
@@ -5,20 +5,21 @@ from database import Database
 db = Database('pnlrg.db')
 db.connect()
 
+program_id = db.fetch_one("SELECT id FROM programs WHERE program_name = 'CTA_50M_30'")['id']
+market_id = db.fetch_one("SELECT id FROM markets WHERE name = 'Rise'")['id']
+
 print("First 15 records with NAV for CTA_50M_30:")
 print("="*70)
 
 data = db.fetch_all("""
-    SELECT pr.date, pr.pnl, pr.nav
-    FROM pnl_records pr
-    JOIN programs p ON pr.program_id = p.id
-    JOIN markets m ON pr.market_id = m.id
-    WHERE p.program_name = 'CTA_50M_30'
-    AND m.name = 'Rise'
-    AND pr.resolution = 'monthly'
-    ORDER BY pr.date
+    SELECT date, pnl, nav
+    FROM pnl_records
+    WHERE program_id = ?
+    AND market_id = ?
+    AND resolution = 'monthly'
+    ORDER BY date
     LIMIT 15
-""")
+""", (program_id, market_id))
 
 for row in data:
     print(f"{row['date']:12}  PnL: ${row['pnl']:10,.2f}  NAV: ${row['nav']:12,.2f}")
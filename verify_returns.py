@@ -9,7 +9,7 @@ db.connect()
 print("Program metadata:")
 print("="*70)
 program = db.fetch_one("""
-    SELECT program_name, fund_size, starting_nav, starting_date
+    SELECT id, program_name, fund_size, starting_nav, starting_date
     FROM programs
     WHERE program_name = 'CTA_50M_30'
 """)
@@ -21,17 +21,17 @@ print(f"Starting Date: {program['starting_date']}")
 print("\n\nFirst 15 percentage returns for CTA_50M_30:")
 print("="*70)
 
+market_id = db.fetch_one("SELECT id FROM markets WHERE name = 'Rise'")['id']
+
 data = db.fetch_all("""
-    SELECT pr.date, pr.return
-    FROM pnl_records pr
-    JOIN programs p ON pr.program_id = p.id
-    JOIN markets m ON pr.market_id = m.id
-    WHERE p.program_name = 'CTA_50M_30'
-    AND m.name = 'Rise'
-    AND pr.resolution = 'monthly'
-    ORDER BY pr.date
+    SELECT date, return
+    FROM pnl_records
+    WHERE program_id = ?
+    AND market_id = ?
+    AND resolution = 'monthly'
+    ORDER BY date
     LIMIT 15
-""")
+""", (program['id'], market_id))
 
 for row in data:
     return_pct = row['return'] * 100  # Convert to percentage
@@ -12,16 +12,32 @@ Key concepts:
 - Statistics: Computed performance metrics for a return series
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict
-from datetime import date
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Dict, NamedTuple, Tuple
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
+from datetime import date, timedelta
 import pandas as pd
 import numpy as np
-from dateutil.relativedelta import relativedelta
 from scipy import stats
+from database import Database
 
 
-@dataclass
+# Canonical program/benchmark ID tuples, so every WindowDefinition in a window set
+# with the same participants shares one tuple object
+_interned_ids: Dict[tuple, tuple] = {}
+
+
+def _intern_ids(ids) -> tuple:
+    """Return the shared tuple equal to tuple(ids)."""
+    ids = tuple(ids)
+    return _interned_ids.setdefault(ids, ids)
+
+
+@dataclass(slots=True, frozen=True)
 class WindowDefinition:
     """
     Lightweight specification of a time window and participants.
@@ -32,8 +48,8 @@ class WindowDefinition:
     Attributes:
         start_date: First date of the window (inclusive)
         end_date: Last date of the window (inclusive)
-        program_ids: List of program IDs to include in analysis
-        benchmark_ids: List of market IDs (where is_benchmark=1) to include
+        program_ids: Program IDs to include in analysis (stored as a shared tuple)
+        benchmark_ids: Market IDs (where is_benchmark=1) to include (stored as a shared tuple)
         name: Optional descriptive name for this window
         window_set: Optional name of the window set this belongs to
         index: Optional position within the window set
@@ -42,21 +58,31 @@ class WindowDefinition:
     """
     start_date: date
     end_date: date
-    program_ids: List[int]
-    benchmark_ids: List[int]
+    program_ids: Tuple[int, ...]
+    benchmark_ids: Tuple[int, ...]
     name: Optional[str] = None
     window_set: Optional[str] = None
     index: Optional[int] = None
     borrowed_data_start_date: Optional[date] = None
     borrowed_data_end_date: Optional[date] = None
 
+    def __post_init__(self):
+        # Accept any sequence of IDs; keep the interned tuple
+        object.__setattr__(self, 'program_ids', _intern_ids(self.program_ids))
+        object.__setattr__(self, 'benchmark_ids', _intern_ids(self.benchmark_ids))
+
+    @property
+    def years(self) -> float:
+        """Window length in years (calendar days / 365.25), as used for CAGR."""
+        return (self.end_date - self.start_date).days / 365.25
+
     def to_dict(self) -> dict:
         """Serialize to JSON-compatible dict."""
         return {
             'start_date': self.start_date.isoformat(),
             'end_date': self.end_date.isoformat(),
-            'program_ids': self.program_ids,
-            'benchmark_ids': self.benchmark_ids,
+            'program_ids': list(self.program_ids),
+            'benchmark_ids': list(self.benchmark_ids),
             'name': self.name,
             'window_set': self.window_set,
             'index': self.index,
@@ -80,7 +106,52 @@ class WindowDefinition:
         )
 
 
-@dataclass
+class ReturnSeries(NamedTuple):
+    """
+    Date-ordered return series held as two parallel arrays.
+
+    Used for the cached full-history series and the window slices taken from
+    them, so slicing and statistics work on typed arrays without a DataFrame.
+
+    Attributes:
+        dates: datetime64[D] array of observation dates (ascending)
+        returns: float64 array of returns as decimals, aligned with dates
+    """
+    dates: np.ndarray
+    returns: np.ndarray
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame with columns ['date', 'return'] for callers that need pandas."""
+        if len(self.dates) == 0:
+            return pd.DataFrame(columns=['date', 'return'])
+        return pd.DataFrame({'date': self.dates.astype('datetime64[ns]'),
+                             'return': self.returns.copy()})
+
+
+_EMPTY_SERIES = ReturnSeries(np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=np.float64))
+
+
+class WindowBounds(NamedTuple):
+    """
+    Date range of one window, without participants or a name.
+
+    Returned by the generate_window_bounds_* functions for callers that only
+    slice data by date (e.g. rolling CAGR), so no WindowDefinition is built.
+
+    Attributes:
+        start_date: First date of the window (inclusive)
+        end_date: Last date of the window (inclusive)
+    """
+    start_date: date
+    end_date: date
+
+    @property
+    def years(self) -> float:
+        """Window length in years (calendar days / 365.25), as WindowDefinition.years."""
+        return (self.end_date - self.start_date).days / 365.25
+
+
+@dataclass(slots=True, frozen=True)
 class Statistics:
     """
     Statistical measures for a return series.
@@ -179,6 +250,9 @@ class Window:
         self.db = db
         self._manager_data: Dict[int, pd.DataFrame] = {}
         self._benchmark_data: Dict[int, pd.DataFrame] = {}
+        self._daily_manager_data: Dict[int, pd.DataFrame] = {}
+        self._daily_manager_returns: Dict[int, np.ndarray] = {}
+        self._daily_benchmark_data: Dict[int, pd.DataFrame] = {}
         self._data_is_complete: Optional[bool] = None
 
     @property
@@ -202,21 +276,33 @@ class Window:
         """
         Verify all requested programs and benchmarks have data covering
         [start_date, end_date] without gaps.
+
+        Reads only the first and last in-window dates from each entity's cached
+        full history; no per-window DataFrame is built just to validate ranges.
         """
         # Check programs
         for program_id in self.definition.program_ids:
-            data = self.get_manager_data(program_id)
-            if not self._has_complete_coverage(data):
+            full = self._get_full_series('manager_monthly', program_id)
+            if not self._series_covers_window(full):
                 return False
 
         # Check benchmarks
+        if self.definition.benchmark_ids and self._get_benchmarks_program_id() is None:
+            return False
         for benchmark_id in self.definition.benchmark_ids:
-            data = self.get_benchmark_data(benchmark_id)
-            if not self._has_complete_coverage(data):
+            full = self._get_full_series('benchmark_monthly', benchmark_id)
+            if not self._series_covers_window(full):
                 return False
 
         return True
 
+    def _series_covers_window(self, full: ReturnSeries) -> bool:
+        """Coverage check on the in-window rows of a full-history series."""
+        lo, hi = self._window_bounds(full)
+        if hi == lo:
+            return False
+        return self._covers_window(full.dates[lo].item(), full.dates[hi - 1].item())
+
     def _has_complete_coverage(self, df: pd.DataFrame) -> bool:
         """
         Check if DataFrame has data for entire window period.
@@ -233,9 +319,19 @@ class Window:
         if df is None or len(df) == 0:
             return False
 
-        data_start = df['date'].min()
-        data_end = df['date'].max()
+        return self._covers_window(df['date'].min(), df['date'].max())
+
+    def _covers_window(self, data_start, data_end) -> bool:
+        """
+        Check if data spanning [data_start, data_end] covers the window's months.
+
+        Args:
+            data_start: First data date (date or Timestamp)
+            data_end: Last data date (date or Timestamp)
 
+        Returns:
+            True if data covers full window, False otherwise
+        """
         # Convert to year-month tuples for comparison
         data_start_ym = (data_start.year, data_start.month)
         data_end_ym = (data_end.year, data_end.month)
@@ -252,12 +348,83 @@ class Window:
 
         return True
 
+    def _get_benchmarks_program_id(self) -> Optional[int]:
+        """
+        ID of the 'Benchmarks' program that holds benchmark returns.
+
+        Memoized in the database's 'windows.benchmarks_program_id' cache, so
+        every window sharing the Database reuses the lookup until the data
+        changes. Returns None if no Benchmarks program exists (not cached, so a
+        later import is picked up).
+        """
+        cache = self.db.cache('windows.benchmarks_program_id', 1)
+        program_id = cache.get('Benchmarks')
+        if program_id is None:
+            row = self.db.fetch_one(
+                "SELECT id FROM programs WHERE program_name = 'Benchmarks'"
+            )
+            if row:
+                program_id = cache['Benchmarks'] = row['id']
+        return program_id
+
+    def _get_full_series(self, kind: str, entity_id: int) -> ReturnSeries:
+        """
+        Full-history return series for entity_id, shared across windows.
+
+        Served from the database's 'windows.series' cache. On a miss, every
+        window participant of the same kind that is not cached yet is fetched
+        with entity_id in one query.
+
+        Args:
+            kind: Key of _FULL_SERIES_SQL ('manager_monthly', 'manager_daily',
+                  'benchmark_monthly' or 'benchmark_daily')
+            entity_id: Program ID for manager kinds, market ID for benchmark kinds
+        """
+        cache = self.db.cache('windows.series', _SERIES_CACHE_SIZE)
+        cached = cache.get((kind, entity_id))
+        if cached is not None:
+            return cached
+
+        if kind.startswith('manager'):
+            participant_ids = self.definition.program_ids
+            prefix = ()
+        else:
+            participant_ids = self.definition.benchmark_ids
+            prefix = (self._get_benchmarks_program_id(),)
+
+        if entity_id in participant_ids:
+            ids = [i for i in dict.fromkeys(participant_ids)
+                   if i == entity_id or (kind, i) not in cache]
+        else:
+            ids = [entity_id]
+
+        results = self.db.fetch_all_tuples(
+            _FULL_SERIES_SQL[kind].format(placeholders=','.join('?' * len(ids))),
+            (*prefix, *ids)
+        )
+        fetched = _series_by_id(results, ids)
+        for i, series in fetched.items():
+            cache[(kind, i)] = series
+
+        return fetched[entity_id]
+
+    def _window_bounds(self, full: ReturnSeries) -> tuple:
+        """Row range [lo, hi) of a date-sorted series falling inside [start_date, end_date]."""
+        lo = int(np.searchsorted(full.dates, np.datetime64(self.definition.start_date, 'D'), side='left'))
+        hi = int(np.searchsorted(full.dates, np.datetime64(self.definition.end_date, 'D'), side='right'))
+        return lo, hi
+
+    def _window_slice(self, full: ReturnSeries) -> ReturnSeries:
+        """Rows of a full-history series inside this window (views, not copies)."""
+        lo, hi = self._window_bounds(full)
+        return ReturnSeries(full.dates[lo:hi], full.returns[lo:hi])
+
     def get_manager_data(self, program_id: int) -> pd.DataFrame:
         """
         Fetch returns for a program within this window.
 
-        Queries database for monthly returns in [start_date, end_date] range.
-        Results are cached for subsequent calls.
+        Slices the program's monthly returns in [start_date, end_date] out of
+        its cached full history. Results are cached for subsequent calls.
 
         Args:
             program_id: Program ID to fetch
@@ -266,24 +433,8 @@ class Window:
             DataFrame with columns ['date', 'return']
         """
         if program_id not in self._manager_data:
-            # Query database for returns in [start_date, end_date]
-            results = self.db.fetch_all("""
-                SELECT pr.date, pr.return
-                FROM pnl_records pr
-                JOIN programs p ON pr.program_id = p.id
-                JOIN markets m ON pr.market_id = m.id
-                WHERE pr.program_id = ?
-                AND m.name = 'Rise'
-                AND pr.resolution = 'monthly'
-                AND pr.date >= ?
-                AND pr.date <= ?
-                ORDER BY pr.date
-            """, (program_id, self.definition.start_date, self.definition.end_date))
-
-            df = pd.DataFrame(results, columns=['date', 'return'])
-            if len(df) > 0:
-                df['date'] = pd.to_datetime(df['date'])
-            self._manager_data[program_id] = df
+            full = self._get_full_series('manager_monthly', program_id)
+            self._manager_data[program_id] = self._window_slice(full).to_dataframe()
 
         return self._manager_data[program_id]
 
@@ -291,8 +442,8 @@ class Window:
         """
         Fetch returns for a benchmark within this window.
 
-        Queries database for monthly benchmark returns in [start_date, end_date] range.
-        Results are cached for subsequent calls.
+        Slices the benchmark's monthly returns in [start_date, end_date] out of
+        its cached full history. Results are cached for subsequent calls.
 
         Args:
             market_id: Market ID to fetch (must have is_benchmark=1)
@@ -301,35 +452,13 @@ class Window:
             DataFrame with columns ['date', 'return']
         """
         if market_id not in self._benchmark_data:
-            # Get the Benchmarks program ID
-            benchmarks_program = self.db.fetch_one(
-                "SELECT id FROM programs WHERE program_name = 'Benchmarks'"
-            )
-
-            if not benchmarks_program:
+            if self._get_benchmarks_program_id() is None:
                 # No benchmarks program exists
                 self._benchmark_data[market_id] = pd.DataFrame(columns=['date', 'return'])
                 return self._benchmark_data[market_id]
 
-            # Query for benchmark returns
-            results = self.db.fetch_all("""
-                SELECT pr.date, pr.return
-                FROM pnl_records pr
-                JOIN markets m ON pr.market_id = m.id
-                WHERE pr.program_id = ?
-                AND pr.market_id = ?
-                AND m.is_benchmark = 1
-                AND pr.resolution = 'monthly'
-                AND pr.date >= ?
-                AND pr.date <= ?
-                ORDER BY pr.date
-            """, (benchmarks_program['id'], market_id,
-                  self.definition.start_date, self.definition.end_date))
-
-            df = pd.DataFrame(results, columns=['date', 'return'])
-            if len(df) > 0:
-                df['date'] = pd.to_datetime(df['date'])
-            self._benchmark_data[market_id] = df
+            full = self._get_full_series('benchmark_monthly', market_id)
+            self._benchmark_data[market_id] = self._window_slice(full).to_dataframe()
 
         return self._benchmark_data[market_id]
 
@@ -350,31 +479,46 @@ class Window:
         Returns:
             DataFrame with columns ['date', 'return'] containing daily returns
         """
-        cache_key = f'daily_{program_id}'
-        if not hasattr(self, '_daily_manager_data'):
-            self._daily_manager_data = {}
-
-        if cache_key not in self._daily_manager_data:
-            # Query database for DAILY returns, aggregated across all NON-BENCHMARK markets
-            results = self.db.fetch_all("""
-                SELECT pr.date, SUM(pr.return) as total_return
-                FROM pnl_records pr
-                JOIN markets m ON pr.market_id = m.id
-                WHERE pr.program_id = ?
-                AND pr.resolution = 'daily'
-                AND pr.date >= ?
-                AND pr.date <= ?
-                AND m.is_benchmark = 0
-                GROUP BY pr.date
-                ORDER BY pr.date
-            """, (program_id, self.definition.start_date, self.definition.end_date))
-
-            df = pd.DataFrame(results, columns=['date', 'return'])
-            if len(df) > 0:
-                df['date'] = pd.to_datetime(df['date'])
-            self._daily_manager_data[cache_key] = df
-
-        return self._daily_manager_data[cache_key]
+        if program_id not in self._daily_manager_data:
+            series = self.get_manager_daily_series(program_id)
+            self._daily_manager_data[program_id] = series.to_dataframe()
+
+        return self._daily_manager_data[program_id]
+
+    def get_manager_daily_series(self, program_id: int) -> ReturnSeries:
+        """
+        Fetch DAILY returns for a program within this window as a ReturnSeries.
+
+        Same rows as get_manager_daily_data(), as array views into the cached
+        full history. Treat the arrays as read-only.
+
+        Args:
+            program_id: Program ID to fetch
+
+        Returns:
+            ReturnSeries of daily dates and returns
+        """
+        return self._window_slice(self._get_full_series('manager_daily', program_id))
+
+    def get_manager_daily_returns(self, program_id: int) -> np.ndarray:
+        """
+        Fetch DAILY returns for a program within this window as a NumPy array.
+
+        Same values as get_manager_daily_data(program_id)['return'], for callers
+        that only need the returns (no dates). Slices the cached full-history
+        return column directly, without building a window DataFrame.
+
+        Args:
+            program_id: Program ID to fetch
+
+        Returns:
+            float64 array of daily returns in date order
+        """
+        if program_id not in self._daily_manager_returns:
+            series = self.get_manager_daily_series(program_id)
+            self._daily_manager_returns[program_id] = series.returns.copy()
+
+        return self._daily_manager_returns[program_id]
 
     def get_benchmark_daily_data(self, market_id: int) -> pd.DataFrame:
         """
@@ -386,42 +530,118 @@ class Window:
         Returns:
             DataFrame with columns ['date', 'return'] containing daily returns
         """
-        cache_key = f'daily_{market_id}'
-        if not hasattr(self, '_daily_benchmark_data'):
-            self._daily_benchmark_data = {}
+        if market_id not in self._daily_benchmark_data:
+            series = self.get_benchmark_daily_series(market_id)
+            self._daily_benchmark_data[market_id] = series.to_dataframe()
 
-        if cache_key not in self._daily_benchmark_data:
-            # Get the Benchmarks program ID
-            benchmarks_program = self.db.fetch_one(
-                "SELECT id FROM programs WHERE program_name = 'Benchmarks'"
-            )
+        return self._daily_benchmark_data[market_id]
 
-            if not benchmarks_program:
-                # No benchmarks program exists
-                self._daily_benchmark_data[cache_key] = pd.DataFrame(columns=['date', 'return'])
-                return self._daily_benchmark_data[cache_key]
-
-            # Query for DAILY benchmark returns
-            results = self.db.fetch_all("""
-                SELECT pr.date, pr.return
-                FROM pnl_records pr
-                JOIN markets m ON pr.market_id = m.id
-                WHERE pr.program_id = ?
-                AND pr.market_id = ?
-                AND m.is_benchmark = 1
-                AND pr.resolution = 'daily'
-                AND pr.date >= ?
-                AND pr.date <= ?
-                ORDER BY pr.date
-            """, (benchmarks_program['id'], market_id,
-                  self.definition.start_date, self.definition.end_date))
-
-            df = pd.DataFrame(results, columns=['date', 'return'])
-            if len(df) > 0:
-                df['date'] = pd.to_datetime(df['date'])
-            self._daily_benchmark_data[cache_key] = df
-
-        return self._daily_benchmark_data[cache_key]
+    def get_benchmark_daily_series(self, market_id: int) -> ReturnSeries:
+        """
+        Fetch DAILY returns for a benchmark within this window as a ReturnSeries.
+
+        Same rows as get_benchmark_daily_data(), as array views into the cached
+        full history. Treat the arrays as read-only.
+
+        Args:
+            market_id: Market ID to fetch (must have is_benchmark=1)
+
+        Returns:
+            ReturnSeries of daily dates and returns (empty if no Benchmarks program)
+        """
+        if self._get_benchmarks_program_id() is None:
+            # No benchmarks program exists
+            return _EMPTY_SERIES
+        return self._window_slice(self._get_full_series('benchmark_daily', market_id))
+
+
+# Full-history series queries, one row per (entity_id, date) in entity/date order.
+# Manager series are keyed by program_id; benchmark series by market_id within the
+# Benchmarks program (bound as the first parameter).
+_FULL_SERIES_SQL = {
+    'manager_monthly': """
+        SELECT pr.program_id, pr.date, pr.return
+        FROM pnl_records pr
+        JOIN markets m ON pr.market_id = m.id
+        WHERE pr.program_id IN ({placeholders})
+        AND m.name = 'Rise'
+        AND pr.resolution = 'monthly'
+        ORDER BY pr.program_id, pr.date
+    """,
+    # DAILY returns aggregated across all NON-BENCHMARK markets
+    'manager_daily': """
+        SELECT pr.program_id, pr.date, SUM(pr.return) as total_return
+        FROM pnl_records pr
+        JOIN markets m ON pr.market_id = m.id
+        WHERE pr.program_id IN ({placeholders})
+        AND pr.resolution = 'daily'
+        AND m.is_benchmark = 0
+        GROUP BY pr.program_id, pr.date
+        ORDER BY pr.program_id, pr.date
+    """,
+    'benchmark_monthly': """
+        SELECT pr.market_id, pr.date, pr.return
+        FROM pnl_records pr
+        JOIN markets m ON pr.market_id = m.id
+        WHERE pr.program_id = ?
+        AND pr.market_id IN ({placeholders})
+        AND m.is_benchmark = 1
+        AND pr.resolution = 'monthly'
+        ORDER BY pr.market_id, pr.date
+    """,
+    'benchmark_daily': """
+        SELECT pr.market_id, pr.date, pr.return
+        FROM pnl_records pr
+        JOIN markets m ON pr.market_id = m.id
+        WHERE pr.program_id = ?
+        AND pr.market_id IN ({placeholders})
+        AND m.is_benchmark = 1
+        AND pr.resolution = 'daily'
+        ORDER BY pr.market_id, pr.date
+    """,
+}
+
+# Full-history series are shared by every Window on the same Database instance
+# through db.cache('windows.series'), keyed by (kind, entity_id). The database
+# empties it once its data may have changed; at most this many series are kept.
+_SERIES_CACHE_SIZE = 512
+
+# compute_statistics() results are memoized in db.cache('windows.statistics'), keyed
+# by (entity_type, entity_id, start_date, end_date) and bounded to this many entries
+_STATISTICS_CACHE_SIZE = 4096
+
+
+def clear_series_cache(db: Database):
+    """Drop the full-history series and memoized statistics cached on db."""
+    db.cache('windows.series', _SERIES_CACHE_SIZE).clear()
+    db.cache('windows.statistics', _STATISTICS_CACHE_SIZE).clear()
+
+
+def _series_by_id(results, ids: List[int]) -> Dict[int, ReturnSeries]:
+    """
+    Split (entity_id, date, return) rows into one ReturnSeries per ID.
+
+    Rows must be ordered by entity_id. Works column-wise: dates are parsed once
+    for the whole result and each ID's series is a slice of the shared arrays.
+    IDs with no rows get an empty series.
+    """
+    if not results:
+        return {entity_id: _EMPTY_SERIES for entity_id in ids}
+
+    entity_ids, dates, returns = zip(*results)
+    entity_ids = np.asarray(entity_ids)
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    returns = np.asarray(returns, dtype=np.float64)
+    # Cached arrays are shared by every window slice; guard against in-place edits
+    dates.flags.writeable = False
+    returns.flags.writeable = False
+
+    series = {}
+    for entity_id in ids:
+        lo = int(np.searchsorted(entity_ids, entity_id, side='left'))
+        hi = int(np.searchsorted(entity_ids, entity_id, side='right'))
+        series[entity_id] = ReturnSeries(dates[lo:hi], returns[lo:hi])
+    return series
 
 
 # =============================================================================
@@ -441,26 +661,45 @@ def aggregate_daily_to_monthly(daily_df: pd.DataFrame) -> pd.DataFrame:
     if daily_df is None or len(daily_df) == 0:
         return pd.DataFrame(columns=['date', 'return'])
 
-    # Ensure date is datetime
-    df = daily_df.copy()
-    if not pd.api.types.is_datetime64_any_dtype(df['date']):
-        df['date'] = pd.to_datetime(df['date'])
+    dates = daily_df['date']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
+    dates, returns = _aggregate_series_to_monthly(
+        dates.to_numpy(), daily_df['return'].to_numpy(dtype=np.float64)
+    )
+    return pd.DataFrame({'date': dates, 'return': returns})
 
-    # Group by year-month and compound returns within each month
-    df['year_month'] = df['date'].dt.to_period('M')
 
-    monthly_returns = []
-    for period, group in df.groupby('year_month'):
-        # Compound daily returns to get monthly return
-        monthly_return = (1 + group['return']).prod() - 1
-        # Use last day of the month as the date
-        month_end_date = group['date'].max()
-        monthly_returns.append({
-            'date': month_end_date,
-            'return': monthly_return
-        })
+def _aggregate_series_to_monthly(dates: np.ndarray, returns: np.ndarray,
+                                 assume_sorted: bool = False) -> tuple:
+    """
+    Array core of aggregate_daily_to_monthly().
 
-    return pd.DataFrame(monthly_returns)
+    Args:
+        dates: datetime64 array of daily dates
+        returns: float64 array of daily returns aligned with dates
+        assume_sorted: Skip the date-order check (cached series are date-sorted)
+
+    Returns:
+        (month_end_dates, monthly_returns) arrays, one entry per calendar month
+    """
+    # Months must be contiguous runs for reduceat (SQL already returns date order)
+    if not assume_sorted and np.any(dates[1:] < dates[:-1]):
+        order = np.argsort(dates, kind='stable')
+        dates, returns = dates[order], returns[order]
+
+    # Start index of each calendar month's run, and the last index of each run
+    months = dates.astype('datetime64[M]')
+    starts = np.flatnonzero(np.concatenate(([True], months[1:] != months[:-1])))
+    ends = np.append(starts[1:], len(months)) - 1
+
+    # Compound daily returns within each month (missing returns count as flat,
+    # as in pandas' prod()); the month's last trading day labels it
+    growth = 1.0 + returns
+    growth[np.isnan(growth)] = 1.0
+    monthly_returns = np.multiply.reduceat(growth, starts) - 1.0
+
+    return dates[ends], monthly_returns
 
 
 def annualize_daily_std(daily_std: float, trading_days_per_year: int = 252) -> float:
@@ -506,19 +745,93 @@ def compute_statistics(window: Window, entity_id: int,
         >>> stats = compute_statistics(window, program_id=1, entity_type='manager')
         >>> print(f"CAGR: {stats.cagr:.2%}")
         >>> print(f"Std Dev (annualized from daily): {stats.std_dev:.2%}")
+
+    Results are memoized on the Database instance per (entity, date range) and
+    recomputed once the data may have changed, so overlapping analyses that
+    rebuild the same window reuse the figures.
     """
+    cache = window.db.cache('windows.statistics', _STATISTICS_CACHE_SIZE)
+    key = (entity_type, entity_id, window.definition.start_date, window.definition.end_date)
+    statistics = cache.get(key)
+
+    if statistics is None:
+        statistics = cache[key] = _compute_statistics(window, entity_id, entity_type)
+
+    return statistics
+
+
+def compute_statistics_batch(windows: List[Window], entity_ids: List[int],
+                             entity_type: str = 'manager',
+                             max_workers: int = 1) -> List[List[Statistics]]:
+    """
+    Compute statistics for the same entities across many windows.
+
+    Every (window, entity) pair is independent. With max_workers > 1 the
+    windows are split into contiguous chunks and computed in a process pool.
+    Each worker opens its own Database on the same file, because SQLite
+    connections must not be shared across processes. The results are added to
+    the compute_statistics() memo. Process start-up costs more than a few
+    thousand pairs take in-process (about 0.3 ms each once the series cache is
+    warm), so keep the default max_workers=1 for small runs.
+
+    Args:
+        windows: Windows to analyze, all on the same Database
+        entity_ids: Program IDs (entity_type='manager') or market IDs ('benchmark')
+        entity_type: Either 'manager' or 'benchmark'
+        max_workers: Number of worker processes (1 = compute in this process)
+
+    Returns:
+        One list per window holding a Statistics per entity ID, in input order
+    """
+    if max_workers <= 1 or len(windows) < 2:
+        return [[compute_statistics(window, entity_id, entity_type) for entity_id in entity_ids]
+                for window in windows]
+
+    db = windows[0].db
+    db_path = str(db.db_path)
+    stamp = db.change_stamp()
+    definitions = [window.definition for window in windows]
+
+    chunk_size = -(-len(definitions) // max_workers)
+    chunks = [definitions[i:i + chunk_size] for i in range(0, len(definitions), chunk_size)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = [pool.submit(_statistics_worker, db_path, chunk, entity_ids, entity_type)
+                   for chunk in chunks]
+        results = [row for future in futures for row in future.result()]
+
+    # Only memoize if the data did not change while the workers were reading it
+    if db.change_stamp() == stamp:
+        cache = db.cache('windows.statistics', _STATISTICS_CACHE_SIZE)
+        for definition, row in zip(definitions, results):
+            for entity_id, entity_stats in zip(entity_ids, row):
+                cache[(entity_type, entity_id, definition.start_date, definition.end_date)] = entity_stats
+
+    return results
+
+
+def _statistics_worker(db_path: str, definitions: List[WindowDefinition],
+                       entity_ids: List[int], entity_type: str) -> List[List[Statistics]]:
+    """Process-pool body of compute_statistics_batch() for one chunk of windows."""
+    with Database(db_path) as db:
+        return [[compute_statistics(Window(definition, db), entity_id, entity_type)
+                 for entity_id in entity_ids]
+                for definition in definitions]
+
+
+def _compute_statistics(window: Window, entity_id: int, entity_type: str) -> Statistics:
+    """Uncached body of compute_statistics()."""
     # Step 1: Try to get DAILY data first (preferred)
     if entity_type == 'manager':
-        daily_df = window.get_manager_daily_data(entity_id)
+        daily_series = window.get_manager_daily_series(entity_id)
     else:  # entity_type == 'benchmark'
-        daily_df = window.get_benchmark_daily_data(entity_id)
+        daily_series = window.get_benchmark_daily_series(entity_id)
 
     # Step 2: Check if we have daily data
-    has_daily_data = daily_df is not None and len(daily_df) > 0
+    has_daily_data = len(daily_series.returns) > 0
 
     if has_daily_data:
         # NEW PATH: Use daily data for std dev, aggregate to monthly for other stats
-        daily_returns = daily_df['return'].values
+        daily_returns = daily_series.returns
         daily_count = len(daily_returns)
 
         # Calculate std dev from DAILY returns (industry standard)
@@ -530,9 +843,11 @@ def compute_statistics(window: Window, entity_id: int,
             daily_std_annualized = float('nan')
 
         # Aggregate daily to monthly for other statistics
-        monthly_df = aggregate_daily_to_monthly(daily_df)
+        _, monthly_returns = _aggregate_series_to_monthly(
+            daily_series.dates, daily_returns, assume_sorted=True
+        )
 
-        if len(monthly_df) == 0:
+        if len(monthly_returns) == 0:
             # Edge case: no monthly data after aggregation
             return Statistics(
                 count=0,
@@ -547,7 +862,6 @@ def compute_statistics(window: Window, entity_id: int,
                 daily_std_dev_raw=daily_std_raw
             )
 
-        monthly_returns = monthly_df['return'].values
         monthly_count = len(monthly_returns)
 
     else:
@@ -586,31 +900,30 @@ def compute_statistics(window: Window, entity_id: int,
     mean = float(monthly_returns.mean()) if monthly_count > 0 else float('nan')
     median = float(np.median(monthly_returns)) if monthly_count > 0 else float('nan')
 
-    # Cumulative returns
-    cumulative_return_compounded = float((1 + pd.Series(monthly_returns)).prod() - 1) if monthly_count > 0 else float('nan')
+    # Cumulative returns and drawdowns. Drawdowns use DAILY data if available for
+    # more accurate intra-month drawdowns (captures drawdowns that occur during a
+    # month, not just month-end values). On the monthly-only path one compounded
+    # NAV pass yields both the cumulative return and the drawdown.
+    if has_daily_data and daily_count > 0:
+        # Calculate drawdowns from daily returns (most accurate)
+        cumulative_return_compounded = float(np.prod(1.0 + monthly_returns) - 1)
+        _, max_dd_comp = _compounded_return_and_drawdown(daily_returns)
+        max_dd_simple = _calculate_max_drawdown_simple(daily_returns)
+    else:
+        # Fallback: Use monthly returns (legacy path)
+        cumulative_return_compounded, max_dd_comp = _compounded_return_and_drawdown(monthly_returns)
+        max_dd_simple = _calculate_max_drawdown_simple(monthly_returns)
     cumulative_return_simple = float(monthly_returns.sum()) if monthly_count > 0 else float('nan')
 
     # CAGR (Compound Annual Growth Rate)
     # Use actual date range for accurate annualization
     if monthly_count > 0 and not np.isnan(cumulative_return_compounded):
         # Calculate years from actual window dates
-        days = (window.definition.end_date - window.definition.start_date).days
-        years = days / 365.25
+        years = window.definition.years
         cagr = float(((1 + cumulative_return_compounded) ** (1.0 / years)) - 1) if years > 0 else 0.0
     else:
         cagr = 0.0
 
-    # Drawdowns: Use DAILY data if available for more accurate intra-month drawdowns
-    # This captures drawdowns that occur during a month, not just month-end values
-    if has_daily_data and daily_count > 0:
-        # Calculate from daily returns (most accurate)
-        max_dd_comp = _calculate_max_drawdown_compounded(daily_returns)
-        max_dd_simple = _calculate_max_drawdown_simple(daily_returns)
-    else:
-        # Fallback: Use monthly returns (legacy path)
-        max_dd_comp = _calculate_max_drawdown_compounded(monthly_returns) if monthly_count > 0 else float('nan')
-        max_dd_simple = _calculate_max_drawdown_simple(monthly_returns) if monthly_count > 0 else float('nan')
-
     return Statistics(
         count=monthly_count,
         mean=mean,
@@ -626,32 +939,32 @@ def compute_statistics(window: Window, entity_id: int,
     )
 
 
-def _calculate_max_drawdown_compounded(returns: np.ndarray) -> float:
+def _compounded_return_and_drawdown(returns: np.ndarray) -> tuple:
     """
-    Calculate maximum drawdown using compounded returns.
+    Calculate cumulative return and maximum drawdown using compounded returns.
 
-    Simulates starting with $1000 and compounding through all returns,
-    then calculates the maximum percentage decline from any running peak.
+    Simulates starting with $1000 and compounding through all returns, then
+    reads the total return off the final NAV and the maximum percentage decline
+    from any running peak, all from the same NAV array.
 
     Args:
         returns: Array of returns as decimals (e.g., 0.03 for 3%)
 
     Returns:
-        Maximum drawdown as a negative decimal (e.g., -0.25 for -25% drawdown)
+        (cumulative_return, max_drawdown) as decimals; (nan, nan) if empty
     """
     if len(returns) == 0:
-        return float('nan')
+        return float('nan'), float('nan')
 
-    # Start with 1000, compound through returns
-    nav = 1000 * (1 + pd.Series(returns)).cumprod()
+    # Compound through returns (the $1000 starting NAV cancels out of the ratio)
+    nav = np.cumprod(1.0 + np.asarray(returns, dtype=np.float64))
+    cumulative_return = float(nav[-1] - 1.0)
 
-    # Calculate running maximum
-    running_max = nav.expanding().max()
+    # Running maximum, then drawdown ratio computed in place in the same buffer
+    running_max = np.maximum.accumulate(nav)
+    np.divide(nav, running_max, out=running_max)
 
-    # Drawdown at each point (as percentage of running max)
-    drawdown = (nav - running_max) / running_max
-
-    return float(drawdown.min())  # Most negative value
+    return cumulative_return, float(running_max.min() - 1.0)  # Most negative value
 
 
 def _calculate_max_drawdown_simple(returns: np.ndarray) -> float:
@@ -674,21 +987,144 @@ def _calculate_max_drawdown_simple(returns: np.ndarray) -> float:
     period_pnls = 1000 * returns
 
     # Cumulative P&L
-    cumulative_pnl = pd.Series(period_pnls).cumsum()
-
-    # Running maximum
-    running_max = cumulative_pnl.expanding().max()
+    cumulative_pnl = np.cumsum(period_pnls, dtype=np.float64)
 
-    # Drawdown (in dollars)
-    drawdown = cumulative_pnl - running_max
+    # Running maximum, then drawdown (in dollars) in the same buffer
+    running_max = np.maximum.accumulate(cumulative_pnl)
+    np.subtract(cumulative_pnl, running_max, out=running_max)
 
-    return float(drawdown.min())  # Most negative value
+    return float(running_max.min())  # Most negative value
 
 
 # =============================================================================
 # Window Generation Functions
 # =============================================================================
 
+# Days per month in a common year
+_MONTH_END = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _last_day(year: int, month: int) -> int:
+    """Last day of (year, month), from the month table plus the leap-year rule."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_END[month - 1]
+
+
+def _add_months(d: date, months: int) -> date:
+    """
+    Shift d by a number of calendar months, clamping to the month's last day.
+
+    Same result as d + relativedelta(months=months) (e.g. Jan 31 + 1 month is
+    Feb 28/29), using integer month arithmetic instead of a relativedelta object.
+    """
+    year, month = divmod(d.year * 12 + d.month - 1 + months, 12)
+    month += 1
+    if d.day <= 28:
+        return date(year, month, d.day)
+    return date(year, month, min(d.day, _last_day(year, month)))
+
+
+def _days_in_month(months: np.ndarray) -> np.ndarray:
+    """Number of days in each month of a datetime64[M] array."""
+    return ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+
+
+def _month_end_bounds(start_months: np.ndarray, start_days: np.ndarray,
+                      window_length_months: int) -> np.ndarray:
+    """
+    Window end dates (datetime64[D]) for window starts given as month + day.
+
+    Each end is _add_months(start, window_length_months) - 1 day, computed for
+    the whole array at once.
+    """
+    end_months = start_months + window_length_months
+    end_days = np.minimum(start_days, _days_in_month(end_months))
+    return end_months.astype('datetime64[D]') + (end_days - 2)
+
+
+# Rolling window bounds and names are pure date math, so they are cached per (dates,
+# length, slide) and shared by repeated generator calls for different programs/benchmarks.
+# Names use date.isoformat() slices, which match strftime('%Y-%m[-%d]') and are cheaper.
+
+@lru_cache(maxsize=128)
+def _overlapping_bounds(start_date: date, end_date: date,
+                        window_length_months: int, slide_months: int) -> tuple:
+    """(start, end, name) of each generate_window_definitions_overlapping() window."""
+    # All candidate start months at once (an upper bound on the window count, with
+    # one spare for zero-length windows, which end the day before they start)
+    first_month = np.datetime64(start_date, 'M')
+    count = int((np.datetime64(end_date, 'M') - first_month).astype(np.int64)) // slide_months + 2
+    if count <= 0:
+        return ()
+    start_months = first_month + np.arange(count) * slide_months
+
+    # Sliding month by month clamps the start day and the clamp carries forward
+    # (Jan 31 -> Feb 28 -> Mar 28), i.e. a running minimum of the clamped days
+    start_days = np.minimum.accumulate(np.minimum(start_date.day, _days_in_month(start_months)))
+    starts = start_months.astype('datetime64[D]') + (start_days - 1)
+    ends = _month_end_bounds(start_months, start_days, window_length_months)
+
+    # Ends increase with the start month; keep windows ending within the data range
+    count = int(np.searchsorted(ends, np.datetime64(end_date, 'D'), side='right'))
+    return tuple(
+        (win_start, win_end, f"Rolling {window_length_months}M ({win_start.isoformat()[:7]})")
+        for win_start, win_end in zip(starts[:count].tolist(), ends[:count].tolist())
+    )
+
+
+@lru_cache(maxsize=128)
+def _overlapping_by_days_bounds(start_date: date, end_date: date,
+                                window_length_months: int, slide_days: int) -> tuple:
+    """(start, end, name) of each generate_window_definitions_overlapping_by_days() window."""
+    # All candidate start dates at once (an upper bound on the window count, with
+    # one spare for zero-length windows, which end the day before they start)
+    first_day = np.datetime64(start_date, 'D')
+    count = int((np.datetime64(end_date, 'D') - first_day).astype(np.int64)) // slide_days + 2
+    if count <= 0:
+        return ()
+    starts = first_day + np.arange(count) * slide_days
+
+    # End date: window_length_months forward, minus 1 day
+    start_months = starts.astype('datetime64[M]')
+    start_days = (starts - start_months.astype('datetime64[D]')).astype(np.int64) + 1
+    ends = _month_end_bounds(start_months, start_days, window_length_months)
+
+    # Ends never decrease as the start slides; keep windows ending within the data range
+    count = int(np.searchsorted(ends, np.datetime64(end_date, 'D'), side='right'))
+    return tuple(
+        (win_start, win_end, f"Rolling {window_length_months}M (ending {win_end.isoformat()})")
+        for win_start, win_end in zip(starts[:count].tolist(), ends[:count].tolist())
+    )
+
+
+@lru_cache(maxsize=128)
+def _overlapping_reverse_bounds(end_date: date, earliest_date: date,
+                                window_length_months: int, slide_months: int) -> tuple:
+    """(start, end, name) of each generate_window_definitions_overlapping_reverse() window, newest first."""
+    # All candidate window end months at once, sliding backward from end_date (an
+    # upper bound on the window count, with one spare for zero-length windows)
+    last_month = np.datetime64(end_date, 'M')
+    count = int((last_month - np.datetime64(earliest_date, 'M')).astype(np.int64)) // slide_months + 2
+    if count <= 0:
+        return ()
+    end_months = last_month - np.arange(count) * slide_months
+
+    # Each end is end_date shifted back whole months (day clamped to the month);
+    # each start is window_length_months before its end, plus 1 day
+    end_days = np.minimum(end_date.day, _days_in_month(end_months))
+    ends = end_months.astype('datetime64[D]') + (end_days - 1)
+    start_months = end_months - window_length_months
+    starts = start_months.astype('datetime64[D]') + np.minimum(end_days, _days_in_month(start_months))
+
+    # Starts decrease as the windows slide back; stop before earliest_date
+    count -= int(np.searchsorted(starts[::-1], np.datetime64(earliest_date, 'D'), side='left'))
+    return tuple(
+        (win_start, win_end, f"Trailing {window_length_months}M (as of {win_end.isoformat()[:7]})")
+        for win_start, win_end in zip(starts[:count].tolist(), ends[:count].tolist())
+    )
+
+
 def generate_window_definitions_non_overlapping_snapped(
     start_date: date,
     end_date: date,
@@ -729,38 +1165,28 @@ def generate_window_definitions_non_overlapping_snapped(
     # Snap to nearest multiple of window_length_years
     snap_year = (start_date.year // window_length_years) * window_length_years
 
-    windows = []
-    current_year = snap_year
-    index = 0
-
-    while True:
-        win_start = date(current_year, 1, 1)
-        win_end = date(current_year + window_length_years - 1, 12, 31)
-
-        # Stop if window starts after our data range
-        if win_start > end_date:
-            break
-
-        # Clip window to actual data range
-        actual_start = max(win_start, start_date)
-        actual_end = min(win_end, end_date)
-
-        # Create window definition
-        win_def = WindowDefinition(
-            start_date=actual_start,
-            end_date=actual_end,
-            program_ids=program_ids.copy(),
-            benchmark_ids=benchmark_ids.copy(),
-            name=f"{current_year}-{current_year + window_length_years - 1}",
+    # One shared ID tuple for every window in the set
+    program_ids = _intern_ids(program_ids)
+    benchmark_ids = _intern_ids(benchmark_ids)
+
+    # Window k covers calendar years snap_year + k*L .. snap_year + (k+1)*L - 1; the
+    # last window is the one starting in or before end_date's year
+    length = window_length_years
+    first_years = range(snap_year, end_date.year + 1, length)
+
+    # Clip each window to the actual data range
+    return [
+        WindowDefinition(
+            start_date=max(date(year, 1, 1), start_date),
+            end_date=min(date(year + length - 1, 12, 31), end_date),
+            program_ids=program_ids,
+            benchmark_ids=benchmark_ids,
+            name=f"{year}-{year + length - 1}",
             window_set=window_set_name,
             index=index
         )
-        windows.append(win_def)
-
-        current_year += window_length_years
-        index += 1
-
-    return windows
+        for index, year in enumerate(first_years)
+    ]
 
 
 def generate_window_definitions_non_overlapping_not_snapped(
@@ -799,13 +1225,17 @@ def generate_window_definitions_non_overlapping_not_snapped(
         ... )
         >>> # Returns: [1973-06 to 1978-05], [1978-06 to 1983-05], ...
     """
+    # One shared ID tuple for every window in the set
+    program_ids = _intern_ids(program_ids)
+    benchmark_ids = _intern_ids(benchmark_ids)
+
     windows = []
     current_start = start_date
     index = 0
 
     while current_start < end_date:
         # Calculate end date (last day of the month before N months later)
-        win_end = current_start + relativedelta(months=window_length_months) - relativedelta(days=1)
+        win_end = _add_months(current_start, window_length_months) - timedelta(days=1)
 
         # Clip to data range
         if win_end > end_date:
@@ -814,16 +1244,16 @@ def generate_window_definitions_non_overlapping_not_snapped(
         win_def = WindowDefinition(
             start_date=current_start,
             end_date=win_end,
-            program_ids=program_ids.copy(),
-            benchmark_ids=benchmark_ids.copy(),
-            name=f"Period {index + 1} ({current_start.strftime('%Y-%m')} to {win_end.strftime('%Y-%m')})",
+            program_ids=program_ids,
+            benchmark_ids=benchmark_ids,
+            name=f"Period {index + 1} ({current_start.isoformat()[:7]} to {win_end.isoformat()[:7]})",
             window_set=window_set_name,
             index=index
         )
         windows.append(win_def)
 
         # Next window starts day after this one ends
-        current_start = win_end + relativedelta(days=1)
+        current_start = win_end + timedelta(days=1)
         index += 1
 
     return windows
@@ -893,14 +1323,19 @@ def generate_window_definitions_non_overlapping_reverse(
         >>> # Window 2: 2010-01-01 to 2014-12-31 (5 years)
         >>> # Window 1: 2015-01-01 to 2020-12-31 (5 years)
     """
-    windows = []
+    # One shared ID tuple for every window in the set
+    program_ids = _intern_ids(program_ids)
+    benchmark_ids = _intern_ids(benchmark_ids)
+
+    # Collect (start, end) periods newest first, then build the definitions once in
+    # chronological order so no reverse-and-reindex pass is needed
+    periods = []
     current_end = latest_date
-    index = 0
     last_complete_window_start = None
 
     while True:
         # Calculate start date (exactly window_length_years before end)
-        win_start = current_end - relativedelta(years=window_length_years)
+        win_start = _add_months(current_end, -12 * window_length_years)
 
         # If this window starts before our earliest data
         if win_start < earliest_date:
@@ -908,46 +1343,33 @@ def generate_window_definitions_non_overlapping_reverse(
             last_complete_window_start = current_end
             break
 
-        # Create window definition
-        # Name shows the period ending date
-        win_def = WindowDefinition(
-            start_date=win_start,
-            end_date=current_end,
-            program_ids=program_ids.copy(),
-            benchmark_ids=benchmark_ids.copy(),
-            name=f"Period ending {current_end.strftime('%Y-%m-%d')}",
-            window_set=window_set_name,
-            index=index
-        )
-        windows.append(win_def)
+        periods.append((win_start, current_end))
 
         # Move to next window (ending the day before this one starts)
-        current_end = win_start - relativedelta(days=1)
-        index += 1
+        current_end = win_start - timedelta(days=1)
 
     # Check if there's still data before the last complete window
-    # If so, create an incomplete window starting from earliest_date
+    # If so, add an incomplete window starting from earliest_date
     if last_complete_window_start is not None:
-        potential_incomplete_end = last_complete_window_start - relativedelta(days=1)
+        potential_incomplete_end = last_complete_window_start - timedelta(days=1)
         if potential_incomplete_end >= earliest_date:
             # There's data for an incomplete window
-            win_def = WindowDefinition(
-                start_date=earliest_date,
-                end_date=potential_incomplete_end,
-                program_ids=program_ids.copy(),
-                benchmark_ids=benchmark_ids.copy(),
-                name=f"Period ending {potential_incomplete_end.strftime('%Y-%m-%d')}",
-                window_set=window_set_name,
-                index=index
-            )
-            windows.append(win_def)
-
-    # Reverse to return in chronological order (oldest first)
-    windows.reverse()
+            periods.append((earliest_date, potential_incomplete_end))
 
-    # Re-index after reversing
-    for i, win in enumerate(windows):
-        win.index = i
+    # Chronological order (oldest first); name shows the period ending date
+    periods.reverse()
+    windows = [
+        WindowDefinition(
+            start_date=win_start,
+            end_date=win_end,
+            program_ids=program_ids,
+            benchmark_ids=benchmark_ids,
+            name=f"Period ending {win_end.isoformat()}",
+            window_set=window_set_name,
+            index=index
+        )
+        for index, (win_start, win_end) in enumerate(periods)
+    ]
 
     # Handle borrow_mode: extend earliest window if incomplete
     if borrow_mode and len(windows) > 1:
@@ -955,26 +1377,30 @@ def generate_window_definitions_non_overlapping_reverse(
 
         # Check if earliest window is incomplete
         # (i.e., its start_date is later than what a full window would require)
-        ideal_start = earliest_window.end_date - relativedelta(years=window_length_years)
+        ideal_start = _add_months(earliest_window.end_date, -12 * window_length_years)
 
         if earliest_window.start_date > ideal_start:
             # Window is incomplete - need to borrow data
-            # Calculate how much we need to extend the end_date to make it complete
-            actual_duration_days = (earliest_window.end_date - earliest_window.start_date).days
-            target_duration_days = (earliest_window.end_date - ideal_start).days
-            shortage_days = target_duration_days - actual_duration_days
+            # The shortage (target duration minus actual duration, both measured to
+            # the same end_date) is just the gap between the ideal and actual starts;
+            # work in day ordinals so no timedelta is built
+            end_ord = earliest_window.end_date.toordinal()
+            shortage_days = earliest_window.start_date.toordinal() - ideal_start.toordinal()
 
             # Extend end_date forward to borrow from next window
-            new_end_date = earliest_window.end_date + relativedelta(days=shortage_days)
+            new_end_date = date.fromordinal(end_ord + shortage_days)
 
             # The borrowed period is from the old end_date + 1 day to new end_date
-            borrowed_start = earliest_window.end_date + relativedelta(days=1)
+            borrowed_start = date.fromordinal(end_ord + 1)
             borrowed_end = new_end_date
 
             # Update the window
-            earliest_window.end_date = new_end_date
-            earliest_window.borrowed_data_start_date = borrowed_start
-            earliest_window.borrowed_data_end_date = borrowed_end
+            windows[0] = replace(
+                earliest_window,
+                end_date=new_end_date,
+                borrowed_data_start_date=borrowed_start,
+                borrowed_data_end_date=borrowed_end
+            )
 
     return windows
 
@@ -1018,39 +1444,23 @@ def generate_window_definitions_overlapping(
         ... )
         >>> # Returns: [1973-06 to 1974-05], [1973-07 to 1974-06], ...
     """
-    if program_ids is None:
-        program_ids = []
-    if benchmark_ids is None:
-        benchmark_ids = []
-
-    windows = []
-    current_start = start_date
-    index = 0
+    # One shared ID tuple for every window in the set (default: none)
+    program_ids = _intern_ids(program_ids or ())
+    benchmark_ids = _intern_ids(benchmark_ids or ())
 
-    while True:
-        # Calculate end date
-        win_end = current_start + relativedelta(months=window_length_months) - relativedelta(days=1)
-
-        # Stop if window extends beyond data range
-        if win_end > end_date:
-            break
-
-        win_def = WindowDefinition(
-            start_date=current_start,
+    return [
+        WindowDefinition(
+            start_date=win_start,
             end_date=win_end,
-            program_ids=program_ids.copy(),
-            benchmark_ids=benchmark_ids.copy(),
-            name=f"Rolling {window_length_months}M ({current_start.strftime('%Y-%m')})",
+            program_ids=program_ids,
+            benchmark_ids=benchmark_ids,
+            name=name,
             window_set=window_set_name,
             index=index
         )
-        windows.append(win_def)
-
-        # Slide forward
-        current_start += relativedelta(months=slide_months)
-        index += 1
-
-    return windows
+        for index, (win_start, win_end, name) in enumerate(
+            _overlapping_bounds(start_date, end_date, window_length_months, slide_months))
+    ]
 
 
 def generate_window_definitions_overlapping_by_days(
@@ -1094,39 +1504,23 @@ def generate_window_definitions_overlapping_by_days(
         >>> # Returns: [2006-01-03 to 2007-01-02], [2006-01-04 to 2007-01-03], ...
         >>> # (one window per day, each spanning 12 months)
     """
-    if program_ids is None:
-        program_ids = []
-    if benchmark_ids is None:
-        benchmark_ids = []
-
-    windows = []
-    current_start = start_date
-    index = 0
-
-    while True:
-        # Calculate end date (window_length_months forward, minus 1 day)
-        win_end = current_start + relativedelta(months=window_length_months) - relativedelta(days=1)
+    # One shared ID tuple for every window in the set (default: none)
+    program_ids = _intern_ids(program_ids or ())
+    benchmark_ids = _intern_ids(benchmark_ids or ())
 
-        # Stop if window extends beyond data range
-        if win_end > end_date:
-            break
-
-        win_def = WindowDefinition(
-            start_date=current_start,
+    return [
+        WindowDefinition(
+            start_date=win_start,
             end_date=win_end,
-            program_ids=program_ids.copy(),
-            benchmark_ids=benchmark_ids.copy(),
-            name=f"Rolling {window_length_months}M (ending {win_end.strftime('%Y-%m-%d')})",
+            program_ids=program_ids,
+            benchmark_ids=benchmark_ids,
+            name=name,
             window_set=window_set_name,
             index=index
         )
-        windows.append(win_def)
-
-        # Slide forward by days
-        current_start += relativedelta(days=slide_days)
-        index += 1
-
-    return windows
+        for index, (win_start, win_end, name) in enumerate(
+            _overlapping_by_days_bounds(start_date, end_date, window_length_months, slide_days))
+    ]
 
 
 def generate_window_definitions_overlapping_reverse(
@@ -1168,41 +1562,74 @@ def generate_window_definitions_overlapping_reverse(
         ... )
         >>> # Returns: [2016-06 to 2017-05], [2016-05 to 2017-04], ...
     """
-    if program_ids is None:
-        program_ids = []
-    if benchmark_ids is None:
-        benchmark_ids = []
-
-    windows = []
-    index = 0
-    offset_months = 0
-
-    while True:
-        # Calculate window dates
-        win_end = end_date - relativedelta(months=offset_months)
-        win_start = win_end - relativedelta(months=window_length_months) + relativedelta(days=1)
+    # One shared ID tuple for every window in the set (default: none)
+    program_ids = _intern_ids(program_ids or ())
+    benchmark_ids = _intern_ids(benchmark_ids or ())
 
-        # Stop if window starts before earliest allowed date
-        if win_start < earliest_date:
-            break
-
-        win_def = WindowDefinition(
+    windows = [
+        WindowDefinition(
             start_date=win_start,
             end_date=win_end,
-            program_ids=program_ids.copy(),
-            benchmark_ids=benchmark_ids.copy(),
-            name=f"Trailing {window_length_months}M (as of {win_end.strftime('%Y-%m')})",
+            program_ids=program_ids,
+            benchmark_ids=benchmark_ids,
+            name=name,
             window_set=window_set_name,
             index=index
         )
-        windows.append(win_def)
-
-        # Slide backward
-        offset_months += slide_months
-        index += 1
+        for index, (win_start, win_end, name) in enumerate(
+            _overlapping_reverse_bounds(end_date, earliest_date, window_length_months, slide_months))
+    ]
 
     # Reverse so most recent window is first
-    return list(reversed(windows))
+    windows.reverse()
+    return windows
+
+
+def generate_window_bounds_overlapping(
+    start_date: date,
+    end_date: date,
+    window_length_months: int,
+    slide_months: int = 1
+) -> List[WindowBounds]:
+    """
+    Bounds of the generate_window_definitions_overlapping() windows, same order.
+
+    For callers that only need each window's dates: no WindowDefinition is built.
+    """
+    return [WindowBounds(win_start, win_end) for win_start, win_end, _ in
+            _overlapping_bounds(start_date, end_date, window_length_months, slide_months)]
+
+
+def generate_window_bounds_overlapping_by_days(
+    start_date: date,
+    end_date: date,
+    window_length_months: int,
+    slide_days: int = 1
+) -> List[WindowBounds]:
+    """
+    Bounds of the generate_window_definitions_overlapping_by_days() windows, same order.
+
+    For callers that only need each window's dates: no WindowDefinition is built.
+    """
+    return [WindowBounds(win_start, win_end) for win_start, win_end, _ in
+            _overlapping_by_days_bounds(start_date, end_date, window_length_months, slide_days)]
+
+
+def generate_window_bounds_overlapping_reverse(
+    end_date: date,
+    earliest_date: date,
+    window_length_months: int,
+    slide_months: int = 1
+) -> List[WindowBounds]:
+    """
+    Bounds of the generate_window_definitions_overlapping_reverse() windows, same order.
+
+    For callers that only need each window's dates: no WindowDefinition is built.
+    """
+    bounds = [WindowBounds(win_start, win_end) for win_start, win_end, _ in
+              _overlapping_reverse_bounds(end_date, earliest_date, window_length_months, slide_months)]
+    bounds.reverse()
+    return bounds
 
 
 def generate_window_definitions_bespoke(
@@ -1237,32 +1664,110 @@ def generate_window_definitions_bespoke(
         ...     benchmark_ids=[5]
         ... )
     """
-    windows = []
+    # One shared ID tuple for every window in the set
+    program_ids = _intern_ids(program_ids)
+    benchmark_ids = _intern_ids(benchmark_ids)
 
-    for index, spec in enumerate(windows_spec):
-        # Parse dates (accept either date objects or ISO strings)
-        start = spec['start_date']
-        if isinstance(start, str):
-            start = date.fromisoformat(start)
+    # One window per spec entry, so the list is sized up front
+    windows = [None] * len(windows_spec)
 
-        end = spec['end_date']
-        if isinstance(end, str):
-            end = date.fromisoformat(end)
+    # Specs often share boundary dates; parse each distinct ISO string once
+    parsed_dates: Dict[str, date] = {}
+
+    def to_date(value):
+        # Accept either date objects or ISO strings
+        if not isinstance(value, str):
+            return value
+        parsed = parsed_dates.get(value)
+        if parsed is None:
+            parsed = parsed_dates[value] = date.fromisoformat(value)
+        return parsed
+
+    spec_fields = itemgetter('start_date', 'end_date', 'name')
+
+    for index, spec in enumerate(windows_spec):
+        start, end, name = spec_fields(spec)
+        start = to_date(start)
+        end = to_date(end)
 
         win_def = WindowDefinition(
             start_date=start,
             end_date=end,
-            program_ids=program_ids.copy(),
-            benchmark_ids=benchmark_ids.copy(),
-            name=spec['name'],
+            program_ids=program_ids,
+            benchmark_ids=benchmark_ids,
+            name=name,
             window_set=window_set_name,
             index=index
         )
-        windows.append(win_def)
+        windows[index] = win_def
 
     return windows
 
 
+# =============================================================================
+# Window Lookup
+# =============================================================================
+
+class WindowIndex:
+    """
+    Date-to-window lookup over a list of window definitions.
+
+    Built once per window set, then answers "which window contains date X" with a
+    binary search over the window start dates instead of a scan of the whole list.
+    Works for any generator's output: windows may be in reverse order, overlap
+    (rolling sets, borrow mode) or vary in length (bespoke sets).
+
+    Example:
+        >>> index = WindowIndex(window_defs)
+        >>> i = index.find(date(2020, 3, 16))
+        >>> window_defs[i].name if i is not None else None
+    """
+
+    __slots__ = ('_order', '_starts', '_ends', '_max_ends')
+
+    def __init__(self, windows: List[WindowDefinition]):
+        """
+        Args:
+            windows: Window definitions to index (not modified)
+        """
+        # Positions in the caller's list, sorted by start date
+        self._order = sorted(range(len(windows)), key=lambda i: windows[i].start_date)
+        self._starts = [windows[i].start_date for i in self._order]
+        self._ends = [windows[i].end_date for i in self._order]
+        # Latest end date among windows starting at or before each position; the
+        # backward walk in find() stops once no earlier window can reach the date
+        self._max_ends = list(accumulate(self._ends, max))
+
+    def find(self, d: date) -> Optional[int]:
+        """
+        Position of the latest-starting window containing d.
+
+        Args:
+            d: Date to look up
+
+        Returns:
+            Index into the list the WindowIndex was built from, or None if no
+            window covers d
+        """
+        ends, max_ends = self._ends, self._max_ends
+        i = bisect_right(self._starts, d) - 1
+        while i >= 0 and max_ends[i] >= d:
+            if ends[i] >= d:
+                return self._order[i]
+            i -= 1
+        return None
+
+
+def find_window(windows: List[WindowDefinition], d: date) -> Optional[int]:
+    """
+    Position in windows of the latest-starting window containing d, or None.
+
+    One-off convenience around WindowIndex; build a WindowIndex directly when
+    looking up many dates against the same window set.
+    """
+    return WindowIndex(windows).find(d)
+
+
 # =============================================================================
 # Event Probability Analysis Functions
 # =============================================================================
@@ -1334,9 +1839,9 @@ def compute_event_probability_analysis(
         >>> print(f"Gain days: {epa.total_gain_days}, Loss days: {epa.total_loss_days}")
     """
     # Step 1: Get daily returns (aggregated across all markets)
-    daily_df = window.get_manager_daily_data(program_id)
+    daily_returns = window.get_manager_daily_returns(program_id)
 
-    if daily_df is None or len(daily_df) == 0:
+    if len(daily_returns) == 0:
         raise ValueError(f"No daily data available for program {program_id} in this window")
 
     # Step 2: Get program metadata
@@ -1355,7 +1860,6 @@ def compute_event_probability_analysis(
         raise ValueError(f"Program {program_id} has no fund_size configured")
 
     # Step 3: Convert returns to dollar P&L
-    daily_returns = daily_df['return'].values
     daily_pnl = daily_returns * fund_size
 
     # Step 4: Calculate realized mean and std dev (for reference and fallback)